@@ -0,0 +1,221 @@
+'''
+asyncio SendInBlue clients.
+
+:class:`AsyncClient` and :class:`AsyncAutomationClient` expose the exact same methods
+as their synchronous counterparts but each of them returns a coroutine::
+
+    api = AsyncClient(apikey)
+    account, lists = await asyncio.gather(api.get_account(), api.get_lists())
+
+Paginated endpoints iterators are asynchronous generators::
+
+    async for contact in api.iter_list_users([list_id]):
+        ...
+
+Requires `aiohttp <https://aiohttp.readthedocs.io/>`_.
+'''
+import asyncio
+import weakref
+
+import aiohttp
+
+from .client import (
+    Client, AutomationClient, ApiUnavailable, CircuitOpen, AUTOMATION_API_URL, DEFAULT_TIMEOUT, POOL_MAXSIZE
+)
+from .ratelimit import THROTTLE_STATUSES, get_limiter
+from .resilience import get_breaker, get_retry_policy
+from .timeouts import get_timeout
+
+DEFAULT_LIMIT = 100
+
+#: Errors worth a retry
+TRANSIENT_ERRORS = (ApiUnavailable, aiohttp.ClientConnectionError, asyncio.TimeoutError)
+#: Errors raised before a request is sent
+UNSENT_ERRORS = (aiohttp.ClientConnectorError, )
+
+
+def _params(params):
+    '''Convert query parameters the way `requests` does (skip ``None``, expand lists)'''
+    pairs = []
+    for key, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        pairs.extend((key, str(v)) for v in values if v is not None)
+    return pairs
+
+
+class AsyncTransport(object):
+    '''
+    A pool of keep-alive HTTP connections shared by asyncio clients.
+
+    One :class:`aiohttp.ClientSession` is lazily created per event loop.
+
+    :param int limit: Maximum number of simultaneous connections
+    :param int limit_per_host: Maximum number of simultaneous connections per host
+    :param int concurrency: Maximum number of in-flight requests (unlimited by default)
+    :param bool keep_alive: Reuse connections between calls
+    :param limiter: An optional :class:`~sendinblue.ratelimit.RateLimiter`
+        (default to the process-wide one)
+    '''
+    def __init__(self, limit=DEFAULT_LIMIT, limit_per_host=POOL_MAXSIZE, concurrency=None, keep_alive=True,
+                 limiter=None):
+        self.limiter = limiter
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.concurrency = concurrency
+        self.keep_alive = keep_alive
+        self._loops = weakref.WeakKeyDictionary()
+
+    def _state(self):
+        loop = asyncio.get_event_loop()
+        state = self._loops.get(loop)
+        if state is None or state[0].closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                                             force_close=not self.keep_alive)
+            session = aiohttp.ClientSession(connector=connector)
+            semaphore = asyncio.Semaphore(self.concurrency) if self.concurrency else None
+            state = self._loops[loop] = (session, semaphore)
+        return state
+
+    async def request(self, method, url, params=None, timeout=None, group=None, **kwargs):
+        session, semaphore = self._state()
+        limiter = self.limiter or get_limiter()
+        if limiter is not None:
+            delay = limiter.reserve(group)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        # Same semantics as `requests`: a single timeout applies to both connection and reads
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        if semaphore is None:
+            return await self._send(session, limiter, group, method, url, _params(params), timeout, **kwargs)
+        async with semaphore:
+            return await self._send(session, limiter, group, method, url, _params(params), timeout, **kwargs)
+
+    async def _send(self, session, limiter, group, method, url, params, timeout, **kwargs):
+        async with session.request(method, url, params=params, timeout=timeout, **kwargs) as response:
+            if limiter is not None:
+                limiter.feedback(group, response.status)
+            if response.status in THROTTLE_STATUSES:
+                raise ApiUnavailable('SendInBlue answered with status {0}'.format(response.status))
+            return await response.json(content_type=None)
+
+    async def close(self):
+        '''Close the connections pooled for the current event loop'''
+        state = self._loops.pop(asyncio.get_event_loop(), None)
+        if state is not None:
+            await state[0].close()
+
+
+_transport = AsyncTransport()
+
+
+def get_async_transport():
+    '''Get the default process-wide asyncio transport'''
+    return _transport
+
+
+def configure_async_transport(**kwargs):
+    '''
+    Replace the default asyncio transport.
+
+    Accepts the same parameters as :class:`AsyncTransport`.
+    '''
+    global _transport
+    _transport = AsyncTransport(**kwargs)
+    return _transport
+
+
+class AsyncClient(Client):
+    '''An asyncio SendInBlue API 2.0 Client'''
+    @property
+    def transport(self):
+        return self._transport or get_async_transport()
+
+    def _kwargs(self, timeout=None):
+        return {
+            'headers': {'Content-Type': 'application/json', 'api-key': self.apikey},
+            'timeout': timeout or self.timeout or DEFAULT_TIMEOUT,
+        }
+
+    async def _call(self, endpoint, arguments):
+        '''Asynchronously call an endpoint, see :meth:`Client._call`'''
+        path, params = endpoint.build(arguments)
+        method = getattr(self, endpoint.method.lower())
+        timeout = self.timeout or get_timeout(endpoint.name, endpoint.group)
+        breaker = get_breaker(endpoint.group)
+        delays = get_retry_policy().delays()
+        while True:
+            if not breaker.allow():
+                raise CircuitOpen('Circuit open for "{0}" endpoints'.format(endpoint.group))
+            try:
+                response = await method(path, params, timeout=timeout, group=endpoint.group)
+            except TRANSIENT_ERRORS as e:
+                breaker.failure()
+                retry = endpoint.idempotent or isinstance(e, UNSENT_ERRORS)
+                delay = next(delays, None) if retry else None
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                breaker.success()
+                return response
+
+    async def _paginate(self, endpoint, arguments, prefetch=False):
+        '''Asynchronously iterate over the records of a paginated endpoint'''
+        page_limit = arguments['page_limit']
+        page = 1
+        response = await self._call(endpoint, dict(arguments, page=page))
+        while True:
+            records = self._records(endpoint, response)
+            last = len(records) < page_limit
+            following = None
+            if prefetch and not last:
+                following = asyncio.ensure_future(self._call(endpoint, dict(arguments, page=page + 1)))
+            for record in records:
+                yield record
+            if last:
+                break
+            page += 1
+            response = await (following or self._call(endpoint, dict(arguments, page=page)))
+
+    async def get(self, path, params=None, timeout=None, group=None, **kwargs):
+        '''GET operation helper'''
+        return await self.transport.request('GET', self._url(path), params=params or kwargs, group=group,
+                                            **self._kwargs(timeout))
+
+    async def post(self, path, data=None, timeout=None, group=None, **kwargs):
+        '''POST operation helper'''
+        return await self.transport.request('POST', self._url(path), json=data or kwargs, group=group,
+                                            **self._kwargs(timeout))
+
+    async def put(self, path, data=None, timeout=None, group=None, **kwargs):
+        '''PUT operation helper'''
+        return await self.transport.request('PUT', self._url(path), json=data or kwargs, group=group,
+                                            **self._kwargs(timeout))
+
+    async def delete(self, path, data=None, timeout=None, group=None, **kwargs):
+        '''DELETE operation helper'''
+        return await self.transport.request('DELETE', self._url(path), json=(data or kwargs) or None, group=group,
+                                            **self._kwargs(timeout))
+
+
+class AsyncAutomationClient(AutomationClient):
+    '''An asyncio SendInBlue Automation API Client'''
+    @property
+    def transport(self):
+        return self._transport or get_async_transport()
+
+    async def execute(self, sib_type, **data):
+        data['key'] = self.apikey
+        data['sib_type'] = sib_type
+        breaker = get_breaker('automation')
+        if not breaker.allow():
+            raise CircuitOpen('Circuit open for automation')
+        try:
+            response = await self.transport.request('GET', AUTOMATION_API_URL, params=data, group='automation',
+                                                    timeout=self.timeout or get_timeout('automation'))
+        except TRANSIENT_ERRORS:
+            breaker.failure()
+            raise
+        breaker.success()
+        return response
@@ -5,3 +5,32 @@ class SendInBlueConfig(AppConfig):
     name = 'sendinblue'
     label = 'sendinblue'
     verbose_name = 'SendInBlue'
+
+    def ready(self):
+        from . import cache, client, ratelimit, resilience, signals, timeouts  # noqa: F401
+        from .utils import setting
+
+        profiles = setting('TIMEOUTS')
+        if profiles:
+            timeouts.configure_timeouts(profiles)
+
+        retry = setting('RETRY')
+        if retry is not None:
+            resilience.configure_retry(**retry)
+
+        breaker = setting('CIRCUIT_BREAKER')
+        if breaker is not None:
+            resilience.configure_breakers(**breaker)
+
+        limits = setting('RATE_LIMITS')
+        if limits:
+            ratelimit.configure_limiter(limits, cache=cache.get_cache if setting('RATE_LIMITS_SHARED') else None)
+
+        transport = setting('TRANSPORT')
+        if transport:
+            client.configure_transport(**transport)
+
+        async_transport = setting('ASYNC_TRANSPORT')
+        if async_transport:
+            from . import aio
+            aio.configure_async_transport(**async_transport)
@@ -0,0 +1,63 @@
+'''
+SendInBlue contact attributes registry.
+
+Attributes metadata is fetched once per site and shared through the Django cache.
+It is refreshed on demand (the admin refresh action), by ``sendinblue_warm_cache``
+or when its ``SENDINBLUE_ATTRIBUTES_TTL`` expires.
+'''
+from wagtail.wagtailcore.models import Site
+
+from . import cache
+from .client import Client, check
+from .utils import setting
+
+NAMESPACE = 'attributes'
+
+#: Default attributes metadata lifetime in seconds
+ATTRIBUTES_TTL = 24 * 60 * 60
+
+
+def default_site():
+    return Site.objects.filter(is_default_site=True).first() or Site.objects.first()
+
+
+def _fetch(apikey):
+    data = check(Client(apikey).get_attributes())
+    return data['data']['normal_attributes']
+
+
+def _parts(site, settings):
+    return [site.pk, cache.digest(settings.apikey)]
+
+
+def get_attributes(site=None):
+    '''
+    Get the normal attributes metadata of a site's SendInBlue account.
+
+    :param Site site: The site whose account is used (default to the default site)
+    :rtype: list
+    '''
+    from .models import SendinBlueSettings
+    site = site or default_site()
+    settings = SendinBlueSettings.for_site(site)
+    if not settings.apikey:
+        return []
+    return cache.get_shared(NAMESPACE, _parts(site, settings), lambda: _fetch(settings.apikey),
+                            setting('ATTRIBUTES_TTL', ATTRIBUTES_TTL))
+
+
+def get_names(site=None, email=True):
+    '''Get the attributes names, ``EMAIL`` first unless ``email`` is ``False``'''
+    names = [a['name'] for a in get_attributes(site)]
+    return ['EMAIL'] + names if email else names
+
+
+def refresh(site=None):
+    '''Fetch a site's attributes metadata and store it in cache'''
+    from .models import SendinBlueSettings
+    site = site or default_site()
+    settings = SendinBlueSettings.for_site(site)
+    if not settings.apikey:
+        return []
+    key = cache.make_key(NAMESPACE, cache.generation(NAMESPACE), *_parts(site, settings))
+    return cache.refresh(key, lambda: _fetch(settings.apikey), setting('ATTRIBUTES_TTL', ATTRIBUTES_TTL))
@@ -0,0 +1,209 @@
+'''
+Contacts batching.
+
+Contacts upserts and list subscriptions are buffered for a short delay
+(or until enough of them are pending) and sent in bulk:
+
+- upserts into a list are imported with a single ``import_users`` call per list and attributes set
+- subscriptions to the same list are combined into a single ``add_users_list`` call
+
+Each buffered operation returns a :class:`~concurrent.futures.Future`
+resolved with the response of the bulk call it has been sent with::
+
+    batcher = ContactBatcher(Client(apikey))
+    futures = [batcher.upsert(email, {'NAME': name}, list_id=12) for email, name in signups]
+    batcher.flush()
+
+Imports are processed asynchronously by SendInBlue:
+an import response only means the contacts have been accepted.
+'''
+import csv
+import io
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from .client import Client, check
+
+#: Default maximum number of contacts per bulk call
+MAX_SIZE = 500
+#: Default maximum number of seconds an operation stays buffered
+MAX_DELAY = 1.0
+#: The import CSV body delimiter
+DELIMITER = ';'
+
+
+def to_csv(names, contacts):
+    '''Build an ``import_users`` CSV body from ``(email, attributes)`` pairs'''
+    output = io.StringIO()
+    writer = csv.writer(output, delimiter=DELIMITER, lineterminator='\n')
+    writer.writerow(['EMAIL'] + list(names))
+    for email, attributes in contacts:
+        writer.writerow([email] + [attributes.get(name, '') for name in names])
+    return output.getvalue()
+
+
+def chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class ContactBatcher(object):
+    '''
+    Buffer contacts operations and send them in bulk.
+
+    Pending operations are flushed by a background thread
+    once ``max_delay`` seconds elapsed since the oldest one or ``max_size`` are pending.
+
+    :param Client client: The client used to send bulk calls
+    :param int max_size: Maximum number of contacts per bulk call
+    :param float max_delay: Maximum number of seconds an operation stays buffered
+    '''
+    def __init__(self, client, max_size=MAX_SIZE, max_delay=MAX_DELAY):
+        self.client = client
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._contacts = []
+        self._memberships = []
+        self._deadline = None
+        self._closed = False
+        self._thread = None
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        return len(self._contacts) + len(self._memberships)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def upsert(self, email, attributes=None, list_id=None):
+        '''
+        Create or update a contact.
+
+        Contacts without ``list_id`` can't be imported and are sent one by one with ``create_update_user``.
+
+        :rtype: Future
+        '''
+        return self._add(self._contacts, email, dict(attributes or {}), list_id)
+
+    def add_to_list(self, list_id, email):
+        '''
+        Add an existing contact to a list.
+
+        :rtype: Future
+        '''
+        return self._add(self._memberships, list_id, email)
+
+    def _add(self, buffer, *operation):
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('Cannot add operations to a closed ContactBatcher')
+            buffer.append((future, ) + operation)
+            if self._deadline is None:
+                self._deadline = time.time() + self.max_delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='sendinblue-batcher', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def _due(self):
+        if not len(self):
+            return False
+        return self._closed or len(self) >= self.max_size or time.time() >= self._deadline
+
+    def _take(self):
+        contacts, memberships = self._contacts, self._memberships
+        self._contacts, self._memberships, self._deadline = [], [], None
+        return contacts, memberships
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._due():
+                    if self._closed:
+                        return
+                    timeout = None if self._deadline is None else max(self._deadline - time.time(), 0)
+                    self._condition.wait(timeout)
+                contacts, memberships = self._take()
+            self.send(contacts, memberships)
+
+    def flush(self):
+        '''Send all pending operations now, in the calling thread'''
+        with self._condition:
+            contacts, memberships = self._take()
+        self.send(contacts, memberships)
+
+    def close(self):
+        '''Send all pending operations and stop the background thread'''
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def send(self, contacts, memberships):
+        '''Send buffered operations in bulk and resolve their futures'''
+        contacts = [c for c in contacts if c[0].set_running_or_notify_cancel()]
+        memberships = [m for m in memberships if m[0].set_running_or_notify_cancel()]
+
+        imports = OrderedDict()
+        for future, email, attributes, list_id in contacts:
+            if list_id is None:
+                self._settle([future], self.client.create_update_user, email, attributes)
+                continue
+            names = tuple(sorted(name for name in attributes if name != 'EMAIL'))
+            imports.setdefault((list_id, names), []).append((future, email, attributes))
+
+        for (list_id, names), items in imports.items():
+            for chunk in chunks(items, self.max_size):
+                body = to_csv(names, [(email, attributes) for _, email, attributes in chunk])
+                self._settle([f for f, _, _ in chunk], self.client.import_users, body=body, listids=[list_id])
+
+        lists = OrderedDict()
+        for future, list_id, email in memberships:
+            lists.setdefault(list_id, []).append((future, email))
+
+        for list_id, items in lists.items():
+            for chunk in chunks(items, self.max_size):
+                self._settle([f for f, _ in chunk], self.client.add_users_list, list_id, [e for _, e in chunk])
+
+    def _settle(self, futures, method, *args, **kwargs):
+        try:
+            response = check(method(*args, **kwargs))
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+        else:
+            for future in futures:
+                future.set_result(response)
+
+
+_batchers = {}
+_batchers_lock = threading.Lock()
+_batchers_pid = None
+
+
+def get_batcher(apikey, **options):
+    '''
+    Get the process-wide batcher of an API key.
+
+    Options (see :class:`ContactBatcher`) are only used on creation.
+    '''
+    global _batchers_pid
+    with _batchers_lock:
+        if _batchers_pid != os.getpid():
+            # Background threads do not survive a fork
+            _batchers.clear()
+            _batchers_pid = os.getpid()
+        if apikey not in _batchers:
+            _batchers[apikey] = ContactBatcher(Client(apikey), **options)
+        return _batchers[apikey]
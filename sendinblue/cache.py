@@ -0,0 +1,133 @@
+'''
+Django cache helpers.
+
+The cache alias is selected with the ``SENDINBLUE_CACHE`` setting (default: ``default``).
+'''
+import hashlib
+import logging
+import threading
+import time
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+from .utils import setting
+
+log = logging.getLogger(__name__)
+
+PREFIX = 'sendinblue'
+DEFAULT_STALE_TTL = 24 * 60 * 60
+#: Maximum lifetime of process-local entries, bounding the propagation delay of invalidations
+LOCAL_TTL = 60
+
+_local = {}
+_local_lock = threading.Lock()
+
+
+def get_cache():
+    return caches[setting('CACHE', 'default')]
+
+
+def local_ttl(ttl):
+    '''
+    Bound a lifetime to :data:`LOCAL_TTL` when the cache is local to each process
+    (ie. the default local-memory cache), as invalidations do not reach other processes.
+    '''
+    return min(ttl, LOCAL_TTL) if isinstance(get_cache(), LocMemCache) else ttl
+
+
+def make_key(*parts):
+    '''Build a namespaced cache key'''
+    return ':'.join([PREFIX] + [str(part) for part in parts])
+
+
+def digest(value):
+    '''A short stable digest, to use secrets (ie. API keys) in cache keys'''
+    return hashlib.sha1(str(value).encode('utf-8')).hexdigest()[:16]
+
+
+def refresh(key, fetch, ttl, stale_ttl=DEFAULT_STALE_TTL):
+    '''Fetch a value and store it for ``ttl`` seconds, then keep it as stale for ``stale_ttl`` seconds'''
+    value = fetch()
+    get_cache().set(key, (value, time.time() + ttl), ttl + stale_ttl)
+    return value
+
+
+def get_or_refresh(key, fetch, ttl, stale_ttl=DEFAULT_STALE_TTL, executor=None):
+    '''
+    Stale-while-revalidate cache read.
+
+    A fresh value is returned as is.
+    A stale value is returned immediately while being refreshed in the background
+    (a single refresh per key runs at once).
+    A missing value is fetched synchronously.
+
+    :param str key: The cache key
+    :param callable fetch: Compute the value
+    :param int ttl: Number of seconds the value is considered fresh
+    :param int stale_ttl: Number of seconds a stale value can still be served
+    :param executor: The executor running background refreshes (default to the background thread pool)
+    '''
+    cache = get_cache()
+    cached = cache.get(key)
+    if cached is None:
+        return refresh(key, fetch, ttl, stale_ttl)
+
+    value, fresh_until = cached
+    if fresh_until < time.time() and cache.add(make_key(key, 'lock'), True, ttl):
+        if executor is None:
+            from .pipeline import get_background_executor
+            executor = get_background_executor()
+        executor.submit(_background_refresh, key, fetch, ttl, stale_ttl)
+    return value
+
+
+def _background_refresh(key, fetch, ttl, stale_ttl):
+    try:
+        refresh(key, fetch, ttl, stale_ttl)
+    except Exception:
+        log.exception('Unable to refresh cache key "%s"', key)
+    finally:
+        get_cache().delete(make_key(key, 'lock'))
+
+
+def generation(namespace):
+    '''The current generation of a namespace, to be included in its cache keys'''
+    return get_cache().get_or_set(make_key(namespace, 'generation'), 1, None)
+
+
+def invalidate(namespace):
+    '''Invalidate all cached values of a namespace, in all processes'''
+    cache = get_cache()
+    key = make_key(namespace, 'generation')
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, None)
+    prefix = make_key(namespace, '')
+    with _local_lock:
+        for local_key in [k for k in _local if k.startswith(prefix)]:
+            del _local[local_key]
+
+
+def get_shared(namespace, parts, fetch, ttl):
+    '''
+    A two-level read-through cache.
+
+    Values are kept in the process memory (for at most :data:`LOCAL_TTL` seconds)
+    in front of the Django cache (served stale while revalidating, see :func:`get_or_refresh`).
+
+    :param str namespace: The cache namespace, invalidated as a whole with :func:`invalidate`
+    :param list parts: The value key parts inside the namespace
+    :param callable fetch: Compute the value
+    :param int ttl: Number of seconds the value is considered fresh
+    '''
+    local_key = make_key(namespace, *parts)
+    now = time.time()
+    entry = _local.get(local_key)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+    value = get_or_refresh(make_key(namespace, generation(namespace), *parts), fetch, ttl)
+    with _local_lock:
+        _local[local_key] = (value, now + min(ttl, LOCAL_TTL))
+    return value
@@ -0,0 +1,158 @@
+'''
+Admin dashboard widgets data.
+
+Each widget is loaded by its own function, concurrently with the others.
+A widget which is too slow or which fails is rendered in a degraded state
+instead of blocking the whole dashboard.
+
+Widgets data is cached for ``SENDINBLUE_DASHBOARD_CACHE`` seconds (per widget)
+and stale data is served while being refreshed in the background.
+'''
+import logging
+import time
+
+from collections import OrderedDict, defaultdict
+from concurrent.futures import TimeoutError
+
+from django.utils.translation import ugettext_lazy as _
+
+from . import cache
+from .pipeline import get_background_executor
+from .timeouts import bind, deadline
+from .utils import setting
+
+log = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 5
+DEFAULT_TTL = 5 * 60
+#: Default maximum duration of the widgets loading in seconds, including after their timeout
+DEFAULT_DEADLINE = 30
+
+OK = 'ok'
+LOADING = 'loading'
+UNAVAILABLE = 'unavailable'
+
+
+def get_campaign_stats(api, campaigns=None):
+    '''Count campaigns by type and status'''
+    if campaigns is None:
+        response = api.get_campaigns_v2()
+        campaigns = response['data']['campaign_records'] if response['code'] == api.OK else []
+
+    data = {
+        'classic': {
+            'name': _('Email campaigns'),
+            'icon': 'fa-envelope',
+            'stats':  defaultdict(int),
+        },
+        'sms': {
+            'name': _('SMS campaigns'),
+            'icon': 'fa-mobile',
+            'stats':  defaultdict(int),
+        },
+        'trigger': {
+            'name': _('Trigger marketing'),
+            'icon': 'fa-toggle-right',
+            'stats':  defaultdict(int),
+        }
+    }
+
+    for campaign in campaigns:
+        if campaign['type'] == 'template' or not campaign['type'] == '':
+            continue
+        data[campaign['type']]['stats'][campaign['status']] += 1
+
+    return data
+
+
+def load_account(api):
+    data = api.get_account()
+    return {
+        'infos': data['data'][-1],
+        'plans': data['data'][:-1],
+    }
+
+
+def count_contacts(api):
+    '''
+    Count contacts by summing the subscribers count of all lists.
+
+    Lists are paginated but their members are never fetched,
+    so the cost only depends on the number of lists.
+    A contact subscribed to many lists is counted once per list.
+    '''
+    return sum(int(list_.get('total_subscribers') or 0) for list_ in api.iter_lists())
+
+
+def load_contacts(api):
+    return {'total_contacts': count_contacts(api)}
+
+
+def load_campaigns(api):
+    return {'campaigns': get_campaign_stats(api)}
+
+
+#: Widget loaders by name
+WIDGETS = OrderedDict((
+    ('account', load_account),
+    ('contacts', load_contacts),
+    ('campaigns', load_campaigns),
+))
+
+#: Widget context when its data is not available
+FALLBACKS = {
+    'account': lambda: {'infos': {}, 'plans': []},
+    'contacts': lambda: {'total_contacts': None},
+    'campaigns': lambda: {'campaigns': get_campaign_stats(None, [])},
+}
+
+
+def cache_key(api, name):
+    return cache.make_key('dashboard', cache.generation('dashboard'), cache.digest(api.apikey), name)
+
+
+def fetch(api, name):
+    '''Get a widget data from the cache, fetching it on cache miss'''
+    ttl = setting('DASHBOARD_CACHE', {}).get(name, DEFAULT_TTL)
+    return cache.get_or_refresh(cache_key(api, name), lambda: WIDGETS[name](api), ttl)
+
+
+def warm(api):
+    '''Refresh all widgets data in cache'''
+    ttls = setting('DASHBOARD_CACHE', {})
+    for name, loader in WIDGETS.items():
+        cache.refresh(cache_key(api, name), lambda: loader(api), ttls.get(name, DEFAULT_TTL))
+
+
+def load(api):
+    '''
+    Load all widgets concurrently.
+
+    Each widget waits at most its ``SENDINBLUE_DASHBOARD_TIMEOUTS`` entry (in seconds).
+    Widgets still loading after their timeout keep going in the background
+    until the ``dashboard`` entry of ``SENDINBLUE_DEADLINES`` to fill the cache.
+
+    :returns: the dashboard template context, with a ``widgets`` mapping
+        of each widget state (``ok``, ``loading`` or ``unavailable``)
+    :rtype: dict
+    '''
+    timeouts = setting('DASHBOARD_TIMEOUTS', {})
+    executor = get_background_executor()
+    start = time.time()
+    with deadline(setting('DEADLINES', {}).get('dashboard', DEFAULT_DEADLINE)):
+        futures = OrderedDict((name, executor.submit(bind(fetch), api, name)) for name in WIDGETS)
+
+    context = {'widgets': {}}
+    for name, future in futures.items():
+        remaining = start + timeouts.get(name, DEFAULT_TIMEOUT) - time.time()
+        try:
+            context.update(future.result(timeout=max(remaining, 0)))
+            context['widgets'][name] = OK
+        except TimeoutError:
+            context.update(FALLBACKS[name]())
+            context['widgets'][name] = LOADING
+        except Exception:
+            log.exception('Unable to load dashboard widget "%s"', name)
+            context.update(FALLBACKS[name]())
+            context['widgets'][name] = UNAVAILABLE
+    return context
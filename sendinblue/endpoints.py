@@ -0,0 +1,1078 @@
+'''
+SendInBlue API 2.0 endpoint definitions.
+
+Client methods are generated from this table on first access
+(see :class:`sendinblue.client.Client`).
+
+Reference: https://apidocs.sendinblue.com/
+'''
+import inspect
+
+from ast import literal_eval
+
+from collections import OrderedDict
+from string import Formatter
+
+IDEMPOTENT_METHODS = ('GET', 'PUT', 'DELETE')
+
+
+class Endpoint(object):
+    '''
+    A SendInBlue API endpoint.
+
+    :param str name: The client method name
+    :param str method: The HTTP verb
+    :param str path: The URL path relative to the API root.
+        ``{param}`` placeholders are filled with the matching parameters.
+    :param str params: Space separated method parameters, with optional literal defaults (ie. ``page=1``).
+        ``name:key`` exposes the ``key`` API parameter as ``name``.
+    :param str group: The endpoint family, used to share policies between endpoints
+    :param str paginate: The records key of paginated endpoints
+    :param int page_size: The default page size of paginated endpoints
+        (default to the ``page_limit`` parameter default)
+    :param str paginate_requires: Space separated parameters without which the endpoint ignores pagination,
+        required by its iterator
+    :param bool idempotent: Whether the call can safely be repeated (default to GET, PUT and DELETE).
+        Endpoints which may send messages (ie. ``send_now``) or create records never are, whatever their verb.
+    :param callable prepare: An optional ``(path, params) -> (path, params)`` hook
+    :param str doc: The method docstring
+    '''
+    def __init__(self, name, method, path, params='', group=None, paginate=None, page_size=None,
+                 paginate_requires='', idempotent=None, prepare=None, doc=None):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.params = params
+        self.group = group
+        self.paginate = paginate
+        self._page_size = page_size
+        self.paginate_requires = paginate_requires.split()
+        self.idempotent = method in IDEMPOTENT_METHODS if idempotent is None else idempotent
+        self.prepare = prepare
+        self.doc = doc
+        self._signature = None
+
+    def __repr__(self):
+        return '<Endpoint {0.name}: {0.method} {0.path}>'.format(self)
+
+    @property
+    def keys(self):
+        '''API parameter keys by method parameter name'''
+        keys = OrderedDict()
+        for param in self.params.split():
+            name = param.split('=', 1)[0]
+            name, _, key = name.partition(':')
+            keys[name] = key or name
+        return keys
+
+    @property
+    def signature(self):
+        '''The generated method :class:`inspect.Signature`'''
+        if self._signature is None:
+            parameters = [inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+            for param in self.params.split():
+                name, _, default = param.partition('=')
+                name = name.split(':')[0]
+                default = literal_eval(default) if default else inspect.Parameter.empty
+                parameters.append(inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                                    default=default))
+            self._signature = inspect.Signature(parameters)
+        return self._signature
+
+    @property
+    def page_size(self):
+        return self._page_size or self.signature.parameters['page_limit'].default
+
+    def build(self, arguments):
+        '''
+        Build a request from the method arguments.
+
+        :param dict arguments: The method arguments by parameter name
+        :returns: the URL path and the API parameters
+        :rtype: tuple
+        '''
+        keys = self.keys
+        params = OrderedDict((keys[name], value) for name, value in arguments.items())
+        placeholders = [field for _, field, _, _ in Formatter().parse(self.path) if field]
+        path = self.path.format(**params)
+        for field in placeholders:
+            params.pop(field)
+        if self.prepare:
+            path, params = self.prepare(path, params)
+        return path, params
+
+    def method_factory(self):
+        '''Build the client method calling this endpoint'''
+        endpoint = self
+        signature = self.signature
+
+        def method(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = OrderedDict(bound.arguments)
+            arguments.pop('self')
+            return self._call(endpoint, arguments)
+
+        method.__name__ = self.name
+        method.__doc__ = self.doc
+        method.__signature__ = signature
+        method.endpoint = self
+        return method
+
+    def iterator_factory(self, name):
+        '''Build the client method iterating over all records of this paginated endpoint'''
+        endpoint = self
+        parameters = [p.replace(default=inspect.Parameter.empty) if p.name in self.paginate_requires else p
+                      for p in self.signature.parameters.values() if p.name != 'page']
+        parameters.append(inspect.Parameter('prefetch', inspect.Parameter.KEYWORD_ONLY, default=False))
+        signature = inspect.Signature(parameters)
+
+        def iterator(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = OrderedDict(bound.arguments)
+            arguments.pop('self')
+            prefetch = arguments.pop('prefetch')
+            missing = [param for param in endpoint.paginate_requires if arguments[param] is None]
+            if missing:
+                raise TypeError('{0}() requires {1}'.format(name, ', '.join(missing)))
+            if arguments['page_limit'] is None:
+                arguments['page_limit'] = endpoint.page_size
+            return self._paginate(endpoint, arguments, prefetch=prefetch)
+
+        iterator.__name__ = name
+        iterator.__doc__ = 'Iterate over all records of ``{0}()``, page by page'.format(self.name)
+        iterator.__signature__ = signature
+        iterator.endpoint = self
+        return iterator
+
+
+def campaigns_filters(path, params):
+    '''Campaigns filters are only supported all together, as path segments'''
+    if all(value is not None for value in params.values()):
+        path += 'type/{type}/status/{status}/page/{page}/page_limit/{page_limit}/'.format(**params)
+    return path, {}
+
+
+def lower_status(path, params):
+    return path, dict(params, status=params['status'].lower())
+
+
+ENDPOINTS = OrderedDict((endpoint.name, endpoint) for endpoint in (
+    # Account
+    Endpoint('get_access_tokens', 'GET', 'account/token',
+             group='account', doc='''
+             Get an access token.
+
+             Undocumented API, extracted from
+             https://plugins.trac.wordpress.org/browser/mailin/trunk/inc/mailin.php
+             '''),
+    Endpoint('delete_token', 'POST', 'account/deletetoken', 'token',
+             group='account', doc='''
+             Delete an access token.
+
+             Undocumented API, extracted from
+             https://plugins.trac.wordpress.org/browser/mailin/trunk/inc/mailin.php
+
+             :param str token: The access token to delete
+             '''),
+    Endpoint('get_account', 'GET', 'account',
+             group='account', doc='Get account informations'),
+    Endpoint('get_smtp_details', 'GET', 'account/smtpdetail',
+             group='account', doc='Get SMTP details'),
+    Endpoint('create_child_account', 'POST', 'account',
+             'child_email password company_org first_name last_name credits=None associate_ip=None',
+             group='account', doc='''
+             Create a child account.
+
+             :param str child_email: Email address of Reseller child
+             :param str password: Password of Reseller child to login
+             :param str company_org: Name of Reseller child's company
+             :param str first_name: First name of Reseller child
+             :param str last_name: Last name of Reseller child
+             :params object credits: Number of email & sms credits respectively,
+                 which will be assigned to the Reseller child's account
+                 - email_credit (*int*) number of email credits
+                 - sms_credit (*int*) Number of sms credts
+             :params list associate_ip: Associate dedicated IPs to reseller child.
+                 You can use commas to separate multiple IPs
+             '''),
+    Endpoint('update_child_account', 'PUT', 'account',
+             'auth_key company_org=None first_name=None last_name=None associate_ip=None '
+             'disassociate_ip=None',
+             group='account', doc='''
+             Update a child account.
+
+             :param str auth_key: 16 character authorization key of Reseller child to be modified
+             :param str company_org: Name of Reseller child's company
+             :param str first_name: First name of Reseller child
+             :param str last_name: Last name of Reseller child
+             :param str password: Password of Reseller child to login
+             :params list associate_ip: Associate dedicated IPs to reseller child.
+                 You can use commas to separate multiple IPs
+             :params list disassociate_ip: Disassociate dedicated IPs to reseller child.
+                 You can use commas to separate multiple IPs
+             '''),
+    Endpoint('delete_child_account', 'DELETE', 'account/{auth_key}', 'auth_key',
+             group='account', doc='''
+             Delete a child account.
+
+             :param str auth_key: 16 character authorization key of Reseller child to be deleted
+             '''),
+    Endpoint('get_reseller_child', 'POST', 'account/getchildv2', 'auth_key',
+             group='account', doc='''
+             Get a reseller child account.
+
+             :param str|object auth_key:
+                 a 16 character authorization key of a reseller child or an object.
+                 Example : To get the details of more than one child account,
+                 use, {"key1":"abC01De2fGHI3jkL","key2":"mnO45Pq6rSTU7vWX"}
+             '''),
+    Endpoint('add_remove_child_credits', 'POST', 'account/addrmvcredit',
+             'auth_key add_credit=None rmv_credit=None',
+             group='account', doc='''
+             Add/Remove a reseller child's Email/SMS credits.
+
+             :param str auth_key: 16 character authorization key of Reseller child to modify credits
+             :param dict add_credit: Number of email & sms credits to be added.
+                 (Mandatory: if rmv_credit is empty)
+                 You can assign either email or sms credits, one at a time other will remain 0.
+                 - ``email_credit`` (*int*): number of email credits
+                 - ``sms_credit`` (*int*): Number of sms credts
+             :param dict rmv_credit: Number of email & sms credits to be removed.
+                 (Mandatory: if add_credits is empty)
+                 You can assign either email or sms credits, one at a time other will remain 0.
+                 - ``email_credit`` (*int*): number of email credits
+                 - ``sms_credit`` (*int*): Number of sms credts
+             '''),
+    # SMS
+    Endpoint('send_sms', 'POST', 'sms', "to _from:from text web_url=None tag=None type='marketing'",
+             group='transactional', idempotent=False, doc='''
+             Send a transactional SMS.
+
+             :param str to: The mobile number to send SMS to with country code
+             :param str _from: The name of the sender.
+                 The number of characters is limited to 11 (alphanumeric format)
+             :param str text: The text of the message.
+                 The maximum characters used per SMS is 160, if used more than that,
+                 it will be counted as more than one SMS
+             :param str web_url:
+                 The web URL that can be called once the message is successfully delivered
+             :param str tag: The tag that you can associate with the message
+             :param str type: Type of message.
+                 Possible values - marketing (default) & transactional.
+                 You can use marketing for sending marketing SMS,
+                 & for sending transactional SMS, use transactional type
+             '''),
+    Endpoint('create_sms_campaign', 'POST', 'sms',
+             'name sender=None content=None bat=None listid=None exclude_list=None scheduled_date=None '
+             'send_now=0',
+             group='campaigns', doc='''
+             Create & Schedule your SMS campaigns.
+
+             :param str name: Name of the SMS campaign
+             :param str sender: This allows you to customize the SMS sender.
+                 The number of characters is limited to 11 ( alphanumeric format )
+             :param str content: Content of the message.
+                 The maximum characters used per SMS is 160, if used more than that,
+                 it will be counted as more than one SMS
+             :param str bat: Mobile number with the country code to send test SMS.
+                 The mobile number defined here should belong to one of your contacts
+                 in SendinBlue account and should not be blacklisted
+             :param list listid: These are the list ids to which the SMS campaign is sent
+                 (Mandatory if scheduled_date is not empty)
+             :param list exclude_list:
+                 These are the list ids which will be excluded from the SMS campaign
+             :param str scheduled_date: The day on which the SMS campaign is supposed to run
+             :param int send_now: Flag to send campaign now.
+                 - 0 *(default)* means campaign can't be send now
+                 - 1 means campaign ready to send now
+             '''),
+    Endpoint('update_sms_campaign', 'PUT', 'sms/{id}',
+             'id name=None sender=None content=None bat=None listid=None exclude_list=None '
+             'scheduled_date=None send_now=0',
+             group='campaigns', idempotent=False, doc='''
+             Update your SMS campaigns.
+             :param int id: Id of the SMS campaign
+             :param str name: Name of the SMS campaign
+             :param str sender: This allows you to customize the SMS sender.
+                 The number of characters is limited to 11 ( alphanumeric format )
+             :param str content: Content of the message.
+                 The maximum characters used per SMS is 160, if used more than that,
+                 it will be counted as more than one SMS
+             :param str bat: Mobile number with the country code to send test SMS.
+                 The mobile number defined here should belong to one of your contacts
+                 in SendinBlue account and should not be blacklisted
+             :param list listid: These are the list ids to which the SMS campaign is sent
+                 (Mandatory if scheduled_date is not empty)
+             :param list exclude_list:
+                 These are the list ids which will be excluded from the SMS campaign
+             :param str scheduled_date: The day on which the SMS campaign is supposed to run
+             :param int send_now: Flag to send campaign now.
+                 - 0 *(default)* means campaign can't be send now
+                 - 1 means campaign ready to send now
+             '''),
+    Endpoint('send_bat_sms', 'GET', 'sms/{id}', 'id to',
+             group='campaigns', idempotent=False, doc='''
+             Send a Test SMS.
+
+             :param int id: Id of the SMS campaign [Mandatory]
+             :pram str to: Mobile number with the country code to send test SMS.
+                 The mobile number defined here should belong to one of your contacts
+                 in SendinBlue account and should not be blacklisted
+             '''),
+    # Campaigns
+    Endpoint('get_campaigns_v2', 'GET', 'campaign/detailsv2/',
+             'type=None status=None page=None page_limit=None',
+             group='campaigns', paginate='campaign_records', page_size=500, paginate_requires='type status',
+             prepare=campaigns_filters,
+             doc='''
+             Get all campaigns detail.
+
+             :param str type: Type of campaign. Possible values - classic, trigger, sms, template
+             :param str status: Status of campaign. Possible values -
+                 draft, sent, archive, queued, suspended, in_process, temp_active, temp_inactive
+             :param int page: Page number.
+                 Maximum number of records per request is 500,
+                 if there are more than 500 campaigns then
+                 you can use this parameter to get next 500 results
+             :param int page_limit: This should be a valid number between 1-500 [Optional]
+             '''),
+    Endpoint('get_campaign_v2', 'GET', 'campaign/{id}/detailsv2/', 'id',
+             group='campaigns', doc='''
+             Get a particular campaign detail.
+
+             :param int id: Unique Id of the campaign
+             '''),
+    Endpoint('create_campaign', 'POST', 'campaign',
+             'name subject category=None from_name=None bat=None html_content=None html_url=None '
+             'listid=None scheduled_date=None from_email=None reply_to=None to_field=None '
+             'exclude_list=None attachment_url=None inline_image=0 mirror_active=1 send_now=0',
+             group='campaigns', doc='''
+             Create and Schedule your campaigns.
+
+             :param str name: Name of the campaign
+             :param str subject: Subject of the campaign
+             :param str category: Tag name of the campaign
+             :param str from_name: Sender name from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients,
+                 please make sure that the sender details are defined here, and in case of no sender,
+                 you can add them also via API & for Shared IP clients, if sender exists)
+             :param str bat: Email address for test mail
+             :param str html_content: Body of the content.
+                 The HTML content field must have more than 10 characters
+                 (Mandatory if html_url is empty)
+             :param str html_url: Url which content is the body of content
+                 (Mandatory if html_content is empty)
+             :param list listid: These are the lists to which the campaign has been sent
+                 (Mandatory if scheduled_date is not empty)
+             :param str scheduled_date: The day on which the campaign is supposed to run
+             :param str from_email: Sender email from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients,
+                 please make sure that the sender details are defined here, and in case of no sender,
+                 you can add them also via API & for Shared IP clients, if sender exists)
+             :param str reply_to: The reply to email in the campaign emails
+             :param str to_field: This is to personalize the <<To>> Field.
+                 If you want to include the first name and last name of your recipient,
+                 add [PRENOM] [NOM] To use the contact attributes here,
+                 these should already exist in SendinBlue account
+             :param list exclude_list: These are the lists which must be excluded from the campaign
+             :param str attachment_url: Provide the absolute url of the attachment
+             :param int inline_image: Status of inline image. Possible values:
+                 - 0 *(default)* means image can't be embedded
+                 - 1 means image can be embedded, in the email
+             :param int mirror_active: Status of mirror links in campaign. Possible values:
+                 - 0 means mirror links are deactivated
+                 - 1 (*default)* means mirror links are activated, in the campaign
+             :param int send_now: Flag to send campaign now. Possible values:
+                 - 0 *(default)* means campaign can't be send now
+                 - 1 means campaign ready to send now
+             '''),
+    Endpoint('delete_campaign', 'DELETE', 'campaign/{id}', 'id',
+             group='campaigns', doc='''
+             Delete your campaigns.
+
+             :param int id: Id of campaign to be deleted
+             '''),
+    Endpoint('update_campaign', 'PUT', 'campaign/{id}',
+             'id name=None subject=None category=None from_name=None bat=None html_content=None '
+             'html_url=None listid=None scheduled_date=None from_email=None reply_to=None to_field=None '
+             'exclude_list=None attachment_url=None inline_image=0 mirror_active=1 send_now=0',
+             group='campaigns', idempotent=False, doc='''
+             Update your campaign.
+
+             :param int id: Id of campaign to be modified
+             :param str name: Name of the campaign
+             :param str category: Tag name of the campaign
+             :param str subject: Subject of the campaign.
+             :param str from_name: Sender name from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients,
+                 please make sure that the sender details are defined here,
+                 and in case of no sender, you can add them also via API & for Shared IP clients,
+                 if sender exists)
+             :param str bat: Email address for test mail
+             :param str html_content: Body of the content.
+                 The HTML content field must have more than 10 characters
+             :param str html_url: Url which content is the body of content
+             :param list listid These are the lists to which the campaign has been sent
+                 (Mandatory if scheduled_date is not empty)
+             :param str scheduled_date: The day on which the campaign is supposed to run
+             :param str from_email: Sender email from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients,
+                 please make sure that the sender details are defined here,
+                 and in case of no sender, you can add them also via API & for Shared IP clients,
+                 if sender exists)
+             :param str reply_to: The reply to email in the campaign emails
+             :param str to_field: This is to personalize the <<T>> Field.
+                 If you want to include the first name and last name of your recipient,
+                 add [PRENOM] [NOM].
+                 To use the contact attributes here, these should already exist in SendinBlue account
+             :param list exclude_list: These are the lists which must be excluded from the campaign
+             :param str attachment_url: Provide the absolute url of the attachment
+             :param int inline_image: Status of inline image. Possible values:
+                 - 0 *(default)* means image can't be embedded
+                 - 1 means image can be embedded, in the email
+             :param int mirror_active: Status of mirror links in campaign. Possible values:
+                 - 0 means mirror links are deactivated
+                 - 1 (*default)* means mirror links are activated, in the campaign
+             :param int send_now: Flag to send campaign now. Possible values:
+                 - 0 *(default)* means campaign can't be send now
+                 - 1 means campaign ready to send now
+             '''),
+    Endpoint('campaign_report_email', 'POST', 'campaign/{id}/report',
+             'id email_subject email_content_type email_body email_to=None email_cc=None email_bcc=None '
+             'lang=None',
+             group='campaigns', idempotent=False, doc='''
+             Send report of Sent and Archived campaign.
+
+             :param int id: Id of campaign to send its report
+             :param str email_subject: Message subject
+             :param str email_content_type: Body of the message in text/HTML version.
+                 Possible values - text & html
+             :param str email_body: Body of the message
+             :param str email_to: Email address of the recipient(s).
+             :param str email_cc: Same as email_to but for Cc
+             :param str email_bcc: Same as email_to but for Bcc
+             :param str lang: Language of email content. Possible values - fr (default), en, es, it & pt
+             '''),
+    Endpoint('campaign_recipients_export', 'POST', 'campaign/{id}/recipients', 'id notify_url type',
+             group='campaigns', doc='''
+             Export the recipients of a specified campaign.
+
+             :param int id: Id of campaign to export its recipients
+             :param str notify_url: URL that will be called once the export process is finished
+             :param str type: Type of recipients. Possible values :
+                 all, non_clicker, non_opener, clicker, opener, soft_bounces, hard_bounces & unsubscribes
+             '''),
+    Endpoint('send_bat_email', 'POST', 'campaign/{id}/test', 'id emails',
+             group='campaigns', idempotent=False, doc='''
+             Send a Test Campaign.
+
+             :param int id: Id of the campaign
+             :param list emails: Email address of recipient(s) existing in the one of the lists
+                 & should not be blacklisted.
+             '''),
+    Endpoint('create_trigger_campaign', 'POST', 'campaign',
+             'trigger_name subject category=None from_name=None bat=None html_content=None html_url=None '
+             'listid=None scheduled_date=None from_email=None reply_to=None to_field=None '
+             'exclude_list=None recurring=0 attachment_url=None inline_image=0 mirror_active=1 '
+             'send_now=0',
+             group='campaigns', doc='''
+             Create and schedule your Trigger campaigns.
+
+             :param str trigger_name: Name of the campaign
+             :param str subject: Subject of the campaign
+             :param str category: Tag name of the campaign
+             :param str from_name: Sender name from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients,
+                 please make sure that the sender details are defined here,
+                 and in case of no sender,
+                 you can add them also via API & for Shared IP clients, if sender exists)
+             :param str bat: Email address for test mail
+             :param str html_content: Body of the content.
+                 The HTML content field must have more than 10 characters
+                 (Mandatory if html_url is empty)
+             :param str html_url: Url which content is the body of content
+                 (Mandatory if html_content is empty)
+             :param list listid: These are the lists to which the campaign has been sent
+                 (Mandatory if scheduled_date is not empty)
+             :param str scheduled_date: The day on which the campaign is supposed to run
+             :param str from_email: Sender email from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients,
+                 please make sure that the sender details are defined here,
+                 and in case of no sender,
+                 you can add them also via API & for Shared IP clients, if sender exists)
+             :param str reply_to: The reply to email in the campaign emails
+             :param str to_field: This is to personalize the <<To>> Field.
+                 If you want to include the first name and last name of your recipient,
+                 add [PRENOM] [NOM].
+                 To use the contact attributes here, these should already exist in SendinBlue account
+             :param list exclude_list: These are the lists which must be excluded from the campaign
+             :param int recurring: Type of trigger campaign. Possible values:
+                 - 0 *(default)* means contact can receive the same Trigger campaign only once
+                 - 1 means contact can receive the same Trigger campaign several times
+             :param str attachment_url: Provide the absolute url of the attachment
+             :param int inline_image: Status of inline image. Possible values:
+                 - 0 *(default)* means image can't be embedded
+                 - 1 means image can be embedded, in the email
+             :param int mirror_active: Status of mirror links in campaign. Possible values:
+                 - 0 means mirror links are deactivated
+                 - 1 (*default)* means mirror links are activated, in the campaign
+             :param int send_now: Flag to send campaign now. Possible values:
+                 - 0 *(default)* means campaign can't be send now
+                 - 1 means campaign ready to send now
+             '''),
+    Endpoint('update_trigger_campaign', 'PUT', 'campaign/{id}',
+             'id trigger_name subject category=None from_name=None bat=None html_content=None '
+             'html_url=None listid=None scheduled_date=None from_email=None reply_to=None to_field=None '
+             'exclude_list=None recurring=0 attachment_url=None inline_image=0 mirror_active=1 '
+             'send_now=0',
+             group='campaigns', idempotent=False, doc='''
+             Update and schedule your Trigger campaigns.
+
+             :param int id: Id of Trigger campaign to be modified
+             :param str trigger_name: Name of the campaign
+             :param str subject: Subject of the campaign
+             :param str category: Tag name of the campaign
+             :param str from_name: Sender name from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients,
+                 please make sure that the sender details are defined here,
+                 and in case of no sender,
+                 you can add them also via API & for Shared IP clients, if sender exists)
+             :param str bat: Email address for test mail
+             :param str html_content: Body of the content.
+                 The HTML content field must have more than 10 characters
+                 (Mandatory if html_url is empty)
+             :param str html_url: Url which content is the body of content
+                 (Mandatory if html_content is empty)
+             :param list listid: These are the lists to which the campaign has been sent
+                 (Mandatory if scheduled_date is not empty)
+             :param str scheduled_date: The day on which the campaign is supposed to run
+             :param str from_email: Sender email from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients,
+                 please make sure that the sender details are defined here,
+                 and in case of no sender,
+                 you can add them also via API & for Shared IP clients, if sender exists)
+             :param str reply_to: The reply to email in the campaign emails
+             :param str to_field: This is to personalize the <<To>> Field.
+                 If you want to include the first name and last name of your recipient,
+                 add [PRENOM] [NOM].
+                 To use the contact attributes here, these should already exist in SendinBlue account
+             :param list exclude_list: These are the lists which must be excluded from the campaign
+             :param int recurring: Type of trigger campaign. Possible values:
+                 - 0 *(default)* means contact can receive the same Trigger campaign only once
+                 - 1 means contact can receive the same Trigger campaign several times
+             :param str attachment_url: Provide the absolute url of the attachment
+             :param int inline_image: Status of inline image. Possible values:
+                 - 0 *(default)* means image can't be embedded
+                 - 1 means image can be embedded, in the email
+             :param int mirror_active: Status of mirror links in campaign. Possible values:
+                 - 0 means mirror links are deactivated
+                 - 1 (*default)* means mirror links are activated, in the campaign
+             :param int send_now: Flag to send campaign now. Possible values:
+                 - 0 *(default)* means campaign can't be send now
+                 - 1 means campaign ready to send now
+             '''),
+    Endpoint('share_campaign', 'POST', 'campaign/sharelinkv2', 'camp_ids',
+             group='campaigns',
+             doc='''
+             Get the Campaign name, subject and share link of the classic type campaigns only which are sent.
+
+             For those which are not sent and the rest of campaign types like trigger, template & sms,
+             will return an error message of share link not available.
+
+             :param list camp_ids: Id of campaign to get share link.
+             '''),
+    Endpoint('update_campaign_status', 'PUT', 'campaign/{id}/updatecampstatus', 'id status',
+             group='campaigns', idempotent=False, prepare=lower_status, doc='''
+             Update the Campaign status.
+
+             :param int id: Id of campaign to update its status
+             :param str status: Types of status. Possible values:
+                 suspended, archive, darchive, sent, queued, replicate and replicate_template
+             '''),
+    # Processes
+    Endpoint('get_processes', 'GET', 'process', 'page=1 page_limit=50',
+             group='campaigns', paginate='processes', doc='''
+             Get all the processes information under the account.
+
+             :param int page: Page number
+             :param int page_limit: This should be a valid number between 1-50
+             '''),
+    Endpoint('get_process', 'GET', 'process/{id}', 'id',
+             group='campaigns', doc='''
+             Get a specific process information.
+
+             :param int id: Id of the process
+             '''),
+    # Lists
+    Endpoint('get_lists', 'GET', 'list', 'list_parent=None page=1 page_limit=50',
+             group='contacts', paginate='lists', doc='''
+             Get all lists detail.
+
+             :param list_parent: An existing folder id, can be used to get all lists belonging to it
+             :param int page: Page number
+             :param int page_limit: Page size. This should be a valid number between 1-50
+             '''),
+    Endpoint('get_list', 'GET', 'list/{id}', 'id',
+             group='contacts', doc='''
+             Get a particular list detail.
+
+             :param int id: Id of list to get details
+             '''),
+    Endpoint('create_list', 'POST', 'list', 'list_name list_parent',
+             group='contacts', doc='''
+             Create a new list.
+
+             :param str list_name: Desired name of the list to be created
+             :param int list_parent: Folder ID
+             '''),
+    Endpoint('delete_list', 'DELETE', 'list/{id}', 'id',
+             group='contacts', doc='''
+             Delete a specific list.
+
+             :param int id: Id of list to be deleted
+             '''),
+    Endpoint('update_list', 'PUT', 'list/{id}', 'id list_parent list_name=None',
+             group='contacts', doc='''
+             Update a list.
+
+             :param int id: Id of list to be modified
+             :param int list_parent: Folder ID
+             :param str list_name: Desired name of the list to be modified
+             '''),
+    Endpoint('add_users_list', 'POST', 'list/{id}/users', 'id users',
+             group='contacts', doc='''
+             Add already existing users in the SendinBlue contacts to the list.
+
+             :param int id: Id of list to link users in it
+             :param list users: Email address of the already existing user(s) in the SendinBlue contacts.
+             '''),
+    Endpoint('delete_users_list', 'DELETE', 'list/{id}/delusers', 'id users',
+             group='contacts', doc='''
+             Delete already existing users in the SendinBlue contacts from the list.
+             :param int id: Id of list to unlink users from it
+             :param list users: Email address of the already existing user(s)
+                 in the SendinBlue contacts to be modified.
+             '''),
+    Endpoint('display_list_users', 'GET', 'list/display', 'ids:listids[] timestamp=None page=1 page_limit=500',
+             group='contacts', paginate='data',
+             doc='''
+             This API call will let you display details of all users for the given lists.
+
+             :param ids: These are the list ids to get their data. The ids found will display records
+             :param datetime timestamp: A datetime filter to fetch modified user records >= t.
+             :param int page: Page number
+             :param int page_limit: Page size. This should be a valid number between 1-50
+             '''),
+    # Transactional emails
+    Endpoint('send_email', 'POST', 'email',
+             'subject to _from:from html text=None cc=None bcc=None replyto=None attachment=None headers=None '
+             'inline_image=None',
+             group='transactional', idempotent=False, doc='''
+             Send Transactional Email.
+
+             :param str subject: Message subject
+             :param dict to: Email address of the recipient(s).
+                 It should be a dict(email: label).
+                 Example: ``{'to@example.net': "to whom"}.``
+                 You can use commas to separate multiple recipients
+             :param list _from: Email address for From header.
+                 It should be a list or tuple (email, label).
+                 Example: ``("from@email.com", "from email")``
+             :param str html: Body of the message. (HTML version).
+                 To send inline images,
+                 use ``<img src="{YourFileName.Extension}" alt="image" border="0" >``,
+                 the 'src' attribute value inside {} (curly braces)
+                 should be same as the filename used in 'inline_image' parameter
+             :param str text: Body of the message. (text version)
+             :param dict cc: Same as ``to`` but for Cc.
+             :param dict bcc: Same as ``to`` but for Bcc.
+             :param list replyto: Same as ``_from`` but for Reply To.
+             :param list attachment: Provide the absolute url of the attachment/s.
+                 Possible extension values =
+                 gif, png, bmp, cgm, jpg, jpeg, txt, css, shtml, html, htm,
+                 csv, zip, pdf, xml, doc, xls, ppt, tar, and ez.
+                 To send attachment/s generated on the fly you have to pass your attachment/s filename
+                 and its base64 encoded chunk data as an a :type:`dict`.
+                 Example: ``{'YourFileName.Extension'=>'Base64EncodedChunkData'}``
+             :param list headers: The headers will be sent along with the mail headers in original email.
+                 Example: ``{'Content-Type': 'text/html; charset=iso-8859-1'}``
+             :param list inline_image: Pass your inline image/s filename
+                 and its base64 encoded chunk data as a :type:`dict`.
+                 Example: ``{'YourFileName.Extension': 'Base64EncodedChunkData'}``
+             '''),
+    # Webhooks
+    Endpoint('get_webhooks', 'GET', 'webhook', 'is_plat',
+             group='webhooks', doc='''
+             To retrieve details of all webhooks.
+
+             :param str is_plat: Flag to get webhooks. Possible values:
+                 - `0`: get Transactional webhooks
+                 - `1`: get Marketing webhooks
+                 - `''`: get all webhooks
+             '''),
+    Endpoint('get_webhook', 'GET', 'webhook/{id}', 'id',
+             group='webhooks', doc='''
+             To retrieve details of any particular webhook.
+
+             :param int id: Id of webhook to get details
+             '''),
+    Endpoint('create_webhook', 'POST', 'webhook', 'url events description=None is_plat=0',
+             group='webhooks', doc='''
+             Create a Webhook.
+
+             :param str url: URL that will be triggered by a webhook [Mandatory]
+             :param list events: Set of events. You can use commas to separate multiple events.
+                 Possible values for Transcational webhook:
+                 request, delivered, hard_bounce, soft_bounce, blocked, spam,
+                 invalid_email, deferred, click, opened.
+                 Possible Values for Marketing webhook:
+                 spam, opened, click, hard_bounce, unsubscribe, soft_bounce, list_addition.
+             :param str description: Webook description
+             :param int is_plat: Flag to create webhook type. Possible values:
+                 - `0` *(default)*: create a Transactional webhooks
+                 - `1`: create a Marketing webhooks
+             '''),
+    Endpoint('delete_webhook', 'DELETE', 'webhook/{id}', 'id',
+             group='webhooks', doc='''
+             Delete a webhook.
+
+             :param int id: Id of webhook to be deleted
+             '''),
+    Endpoint('update_webhook', 'PUT', 'webhook/{id}', 'id url events description=None',
+             group='webhooks', doc='''
+             Update a webhook.
+
+             :param int id: Id of webhook to be modified
+             :param str url: URL that will be triggered by a webhook
+             :param list events: Set of events. You can use commas to separate multiple events.
+                 Possible values for Transcational webhook:
+                 request, delivered, hard_bounce, soft_bounce, blocked,
+                 spam, invalid_email, deferred, click, opened.
+                 Possible Values for Marketing webhook:
+                 spam, opened, click, hard_bounce, unsubscribe, soft_bounce, list_addition
+             :param str description: Webook description
+             '''),
+    # Statistics
+    Endpoint('get_statistics', 'POST', 'statistics',
+             'aggregate=None start_date=None end_date=None days=None tag=None',
+             group='statistics', doc='''
+             Aggregate / date-wise report of the SendinBlue SMTP account.
+
+             :param int aggregate: This is used to indicate, you are interested in all-time totals.
+                 Possible values - ``0`` & ``1``.
+                 ``0`` means it will not aggregate records, and will show stats per day/date wise
+             :param str start_date: The start date to look up statistics.
+                 Date must be in YYYY-MM-DD format and should be before the end_date [Optional]
+             :param str end_date: The end date to look up statistics.
+                 Date must be in YYYY-MM-DD format and should be after the start_date [Optional]
+             :param int days: Number of days in the past to include statistics ( Includes today ).
+                 It must be an integer greater than 0 [Optional]
+             :param str tag: The tag you will specify to retrieve detailed stats.
+                 It must be an existing tag that has statistics [Optional]
+             '''),
+    # Users
+    Endpoint('get_user', 'GET', 'user/{email}', 'email',
+             group='contacts', doc='''
+             Get Access a specific user Information.
+
+             :param str email: Email address of the already existing user in the SendinBlue contacts
+             '''),
+    Endpoint('delete_user', 'DELETE', 'user/{email}', 'email',
+             group='contacts', doc='''
+             Unlink existing user from all lists.
+
+             :param str email: Email address of the already existing user in the SendinBlue contacts
+                 to be unlinked from all lists
+             '''),
+    Endpoint('import_users', 'POST', 'user/import',
+             'url=None body=None listids=None notify_url=None name=None list_parent=None',
+             group='contacts', doc='''
+             Import Users Information.
+
+                     :param str url: The URL of the file to be imported.
+                         Possible file types - .txt, .csv
+                         (Mandatory if ``body`` is empty)
+                     :param str body: The Body with csv content to be imported.
+                         Example: ``NAME;SURNAME;EMAIL
+             "Name1";"Surname1";"example1@example.net"``,
+                         where ``
+             `` separates each user data.
+                         You can use semicolon to separate multiple attributes
+                         (Mandatory if ``url`` is empty)
+                     :param list listids: These are the list ids in which the the users will be imported
+                         (Mandatory if name is empty)
+                     :param str notify_url: URL that will be called once the import process is finished.
+                         In notify_url, we are sending the content using POST method
+                     :param str name: This is new list name which will be created first
+                         and then users will be imported in it (Mandatory if ``listids`` is empty)
+                     :param int list_parent: This is the existing folder id
+                         and can be used with name parameter to make newly created list's desired parent
+
+             '''),
+    Endpoint('export_users', 'POST', 'user/export', 'filter export_attrib=None notify_url=None',
+             group='contacts', doc='''
+             Export Users Information.
+
+             :param dict filter: Filter can be added to export users.
+                 Example: ``{'blacklisted': 1}``, will export all blacklisted users
+             :param str export_attrib: The name of attribute present in your SendinBlue account.
+                 You can use commas to separate multiple attributes. Example: ``EMAIL,NAME,SMS``
+             :param str notify_url: URL that will be called once the export process is finished
+             '''),
+    Endpoint('create_update_user', 'POST', 'user/createdituser',
+             'email attributes blacklisted=None listid=None listid_unlink=None blacklisted_sms=None',
+             group='contacts', doc='''
+             Create or update a user.
+
+             If an email provided as input
+             and it doesn't exists in the contact list of your SendinBlue account,
+             it will be created,
+             otherwise it will update the existing user.
+
+             :param str email: Email address of the user to be created in SendinBlue contacts.
+                 Already existing email address of user in the SendinBlue contacts to be modified
+             :param dict attributes: The name of attribute present in your SendinBlue account.
+                 It should be sent as an associative array.
+                 Example: ``{'NAME': 'John Doe'}``.
+                 You can use commas to separate multiple attributes
+             :param int blacklisted: This is used to blacklist/ Unblacklist a user.
+                 Possible values - 0 & 1. blacklisted = 1 means user has been blacklisted
+             :param list listid: The list id(s) to be linked from user
+             :param list listid_unlink: The list id(s) to be unlinked from user
+             :param list blacklisted_sms: This is used to blacklist/ Unblacklist a user's SMS number.
+                 Possible values - ``0`` & ``1``. ``1`` means user's SMS number has been blacklisted
+             '''),
+    # Attributes
+    Endpoint('get_attributes', 'GET', 'attribute',
+             group='contacts', doc='Access all the attributes information under the account.'),
+    Endpoint('get_attribute', 'GET', 'attribute/{type}', 'type',
+             group='contacts', doc='''
+             Access the specific type of attribute information.
+
+             :param str type: Type of attribute.
+                 Possible values - normal, transactional, category, calculated & global
+             '''),
+    Endpoint('create_attribute', 'POST', 'attribute', 'type data',
+             group='contacts', doc='''
+             Create an Attribute.
+
+             :param str type: Type of attribute.
+                 Possible values - normal, transactional, category, calculated, global
+             :param list data: The name and data type of 'normal' & 'transactional'
+                 attribute to be created in your SendinBlue account.
+                 It should be :type:`dict`.
+                 Example: ``{'ATTRIBUTE_NAME1': 'DATA_TYPE1', 'ATTRIBUTE_NAME2': 'DATA_TYPE2'}``.
+                 The name and data value of 'category', 'calculated' & 'global',
+                 should be sent as JSON string.
+                 Example: ``[{ "name":"ATTRIBUTE_NAME1", "value":"Attribute_value1" }]'.
+                 You can use commas to separate multiple attributes
+             '''),
+    Endpoint('delete_attribute', 'POST', 'attribute/{type}', 'type data',
+             group='contacts', doc='''
+             Delete a specific type of attribute information.
+
+             :param int type: Type of attribute to be deleted
+             :param list data: The list of attribute to delet
+             '''),
+    # Reports
+    Endpoint('get_report', 'POST', 'report',
+             'limit=None start_date=None end_date=None offset=None date=None days=None email=None',
+             group='statistics', doc='''
+             Get Email Event report.
+
+             :param int limit: To limit the number of results returned. It should be an integer
+             :param str start_date: The start date to get report from.
+                 Date must be in YYYY-MM-DD format and should be before the end_date
+             :param str end_date: The end date to get report till date.
+                 Date must be in YYYY-MM-DD format and should be after the start_date
+             :param int offset: Beginning point in the list to retrieve from. It should be an integer
+             :param str date: Specific date to get its report.
+                 Date must be in YYYY-MM-DD format and should be earlier than todays date
+             :param int days: Number of days in the past (includes today).
+                 If specified, must be an integer greater than 0
+             :param str email: Email address to search report for
+             '''),
+    # Folders
+    Endpoint('get_folders', 'GET', 'folder', 'page=1 page_limit=50',
+             group='contacts', paginate='folders', doc='''
+             Get all folders detail.
+
+             :param int page: The page number
+             :param int page_limit: The page size. This should be a valid number between 1-50
+             '''),
+    Endpoint('get_folder', 'GET', 'folder/{id}', 'id',
+             group='contacts', doc='''
+             Get a particular folder detail.
+
+             :param int id: Id of folder to get details
+             '''),
+    Endpoint('create_folder', 'POST', 'folder', 'name',
+             group='contacts', doc='''
+             Create a new folder.
+
+             :param str name: Desired name of the folder to be created
+             '''),
+    Endpoint('delete_folder', 'DELETE', 'folder/{id}', 'id',
+             group='contacts', doc='''
+             Delete a specific folder information.
+
+             :param int id: Id of folder to be deleted
+             '''),
+    Endpoint('update_folder', 'PUT', 'folder/{id}', 'id name',
+             group='contacts', doc='''
+             Update an existing folder.
+
+             :param int id: Id of folder to be modified
+             :param str name: Desired name of the folder to be modified
+             '''),
+    # Bounces
+    Endpoint('delete_bounces', 'POST', 'bounces', 'start_date=None end_date=None email=None',
+             group='statistics',
+             doc='''
+             Delete any hardbounce, which actually would have been blocked due to some temporary ISP failures.
+
+             :param str start_date: The start date to get report from.
+                 Date must be in YYYY-MM-DD format and should be before the end_date
+             :param str end_date: The end date to get report till date.
+                 Date must be in YYYY-MM-DD format and should be after the start_date
+             :param str email: Email address to delete its bounces
+             '''),
+    # Templates
+    Endpoint('send_transactional_template', 'PUT', 'template/{id}',
+             'id to cc=None bcc=None attr=None attachment_url=None attachment=None headers=None',
+             group='transactional', idempotent=False,
+             doc='''
+             Send templates created on SendinBlue, through SendinBlue SMTP (transactional mails).
+
+             :param int id: Id of the template created on SendinBlue account
+             :param str to: Email address of the recipient(s).
+                 You can use pipe ( | ) to separate multiple recipients.
+                 Example: "to-example@example.net|to2-example@example.net"
+             :param str cc: Same as to but for Cc
+             :param str bcc: Same as to but for Bcc
+             :param dict attr: The name of attribute present in your SendinBlue account.
+                 It should be a :type:`dict`.
+                 Example: ``{'NAME': 'name'}``.
+                 You can use commas to separate multiple attributes
+             :param str attachment_url: Provide the absolute url of the attachment.
+                 Url not allowed from local machine. File must be hosted somewhere
+             :param dict attachment: To send attachment/s generated on the fly
+                 you have to pass your attachment/s filename
+                 and its base64 encoded chunk data as a :type:`dict`
+             :param dict headers: This headers will be to those in the mail headers in original email.
+                 Example: ``{'Content-Type': 'text/html; charset=iso-8859-1'}``.
+                 You can use commas to separate multiple headers
+             '''),
+    Endpoint('create_template', 'POST', 'template',
+             'subject template_name from_name=None bat=None html_content=None html_url=None '
+             'from_email=None reply_to=None to_field=None status=0 attachment=0',
+             group='campaigns', doc='''
+             Create a Template.
+
+             :param str subject: Subject of the campaign
+             :param str template_name: Name of the Template
+             :param str from_name: Sender name from which the campaign emails are sent
+                 (Mandatory for Dedicated IP clients & for Shared IP clients, if sender exists)
+             :param str bat: Email address for test mail
+             :param str html_content: Body of the content.
+                 The HTML content field must have more than 10 characters
+                 (Mandatory if html_url is empty)
+             :param str html_url: Url which content is the body of content.
+                 (Mandatory if html_content is empty)
+             :param str from_email: Sender email from which the campaign emails are sent.
+                 (Mandatory for Dedicated IP clients & for Shared IP clients, if sender exists)
+             :param str reply_to: The reply to email in the campaign emails
+             :param str to_field: This is to personalize the <<To>> Field.
+                 If you want to include the first name and last name of your recipient,
+                 add [PRENOM] [NOM].
+                 To use the contact attributes here, these should already exist in SendinBlue account
+             :param int status: Status of template. Possible values:
+                 - ``0`` *(default)* means template is inactive
+                 - ``1`` means template is active
+             :param int attachment: Status of attachment. Possible values:
+                 - ``0`` *(default)* means an attachment can't be sent
+                 - ``1`` means an attachment can be sent, in the email
+             '''),
+    Endpoint('update_template', 'PUT', 'template/{id}',
+             'id subject template_name from_name=None bat=None html_content=None html_url=None '
+             'from_email=None reply_to=None to_field=None status=0 attachment=0',
+             group='campaigns', doc='''
+             Update a Template.
+
+             :param int id: Id of Template to be modified
+             :param str subject: Subject of the campaign
+             :param str template_name: Name of the Template
+             :param str from_name: Sender name from which the campaign emails are sent.
+                 (Mandatory for Dedicated IP clients & for Shared IP clients, if sender exists)
+             :param str bat: Email address for test mail
+             :param str html_content: Body of the content.
+                 The HTML content field must have more than 10 characters.
+                 (Mandatory if html_url is empty)
+             :param str html_url: Url which content is the body of content.
+                 (Mandatory if html_content is empty)
+             :param str from_email: Sender email from which the campaign emails are sent.
+                 (Mandatory for Dedicated IP clients & for Shared IP clients, if sender exists)
+             :param str reply_to: The reply to email in the campaign emails
+             :param str to_field: This is to personalize the <<To>> Field.
+                 If you want to include the first name and last name of your recipient,
+                 add [PRENOM] [NOM].
+                 To use the contact attributes here, these should already exist in SendinBlue account
+             :param int status: Status of template. Possible values:
+                 - ``0`` *(default)* means template is inactive
+                 - ``1`` means template is active
+             :param int attachment: Status of attachment. Possible values:
+                 - ``0`` *(default)* means an attachment can't be sent
+                 - ``1`` means an attachment can be sent, in the email
+             '''),
+    # Senders
+    Endpoint('get_senders', 'GET', 'advanced', 'option',
+             group='senders', doc='''
+             Get Access of created senders information.
+
+             :param str option: Options to get senders.
+                 Possible options - IP-wise & Domain-wise ( only for dedicated IP clients ).
+                 Example: to get senders with specific IP, use ``option='1.2.3.4'``,
+                 to get senders with specific domain use, ``option='domain.com'``,
+                 and to get all senders, use ``option=''``
+             '''),
+    Endpoint('create_sender', 'POST', 'advanced', 'name email ip_domain=None',
+             group='senders', doc='''
+             Create your Senders.
+
+             :param str name: Name of the sender
+             :param str email: Email address of the sender
+             :param list ip_domain: Pass pipe ( | ) separated Dedicated IP and its associated Domain.
+                 Example: ``['1.2.3.4|mydomain1.com', '5.6.7.8|mydomain2.com']``.
+                 You can use commas to separate multiple ip_domain's
+                 (Mandatory only for Dedicated IP clients,
+                 for Shared IP clients, it should be kept blank)
+             '''),
+    Endpoint('update_sender', 'PUT', 'advanced/{id}', 'id name ip_domain=None',
+             group='senders', doc='''
+             Update your Senders.
+             :param int id: Id of sender to be modified [Mandatory]
+             :param str name: Name of the sender
+             :param list ip_domain: Pass pipe ( | ) separated Dedicated IP and its associated Domain.
+                 Example: ``['1.2.3.4|mydomain1.com', '5.6.7.8|mydomain2.com']``.
+                 You can use commas to separate multiple ip_domain's
+                 (Mandatory only for Dedicated IP clients,
+                 for Shared IP clients, it should be kept blank)
+             '''),
+    Endpoint('delete_sender', 'DELETE', 'advanced/{id}', 'id',
+             group='senders', doc='''
+             Delete your Sender Information.
+
+             :param in id: Id of sender to be deleted
+             '''),
+))
+
+#: Paginated endpoints iterators
+ITERATORS = OrderedDict((
+    ('iter_campaigns', 'get_campaigns_v2'),
+    ('iter_processes', 'get_processes'),
+    ('iter_lists', 'get_lists'),
+    ('iter_list_users', 'display_list_users'),
+    ('iter_folders', 'get_folders'),
+))
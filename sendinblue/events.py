@@ -0,0 +1,178 @@
+'''
+Fire-and-forget automation events.
+
+:class:`QueuedAutomationClient` exposes the same methods as
+:class:`~sendinblue.client.AutomationClient` but only queues events in memory::
+
+    automation = QueuedAutomationClient(key)
+    automation.track('signup', email_id=email)  # Returns immediately
+
+A background thread sends queued events through the pooled transport.
+When the queue is full, events are dropped or, if a ``spill_dir`` is given,
+appended to a file and sent once the queue is drained (by any process using the same directory).
+'''
+import atexit
+import glob
+import json
+import logging
+import os
+import queue
+import threading
+
+from .client import AutomationClient
+
+log = logging.getLogger(__name__)
+
+#: Default maximum number of queued events
+MAX_SIZE = 1000
+#: Number of seconds the sender waits for events before looking for spilled ones
+IDLE_DELAY = 5
+SPILL_PATTERN = 'sendinblue-events-*.jsonl'
+
+
+class EventSink(object):
+    '''
+    A bounded queue of automation events sent by background threads.
+
+    :param int max_size: Maximum number of queued events
+    :param int workers: Number of sending threads
+    :param str spill_dir: An optional directory where to spill events when the queue is full
+    :param transport: An optional :class:`~sendinblue.client.Transport` used to send events
+    '''
+    def __init__(self, max_size=MAX_SIZE, workers=1, spill_dir=None, transport=None):
+        self.queue = queue.Queue(max_size)
+        self.workers = workers
+        self.spill_dir = spill_dir
+        self.transport = transport
+        self.dropped = 0
+        self._threads = []
+        self._lock = threading.Lock()
+        self._pid = None
+
+    @property
+    def spill_path(self):
+        return os.path.join(self.spill_dir, SPILL_PATTERN.replace('*', str(os.getpid())))
+
+    def _start(self):
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid != pid:
+                # Threads do not survive a fork
+                self._threads = [threading.Thread(target=self._run, name='sendinblue-events', daemon=True)
+                                 for _ in range(self.workers)]
+                for thread in self._threads:
+                    thread.start()
+                self._pid = pid
+
+    def put(self, apikey, sib_type, data, timeout=None):
+        '''
+        Queue an event without blocking (unless a ``timeout`` is given).
+
+        :returns: ``False`` if the event has been dropped
+        :rtype: bool
+        '''
+        self._start()
+        event = (apikey, sib_type, data)
+        try:
+            self.queue.put(event, block=timeout is not None, timeout=timeout)
+        except queue.Full:
+            return self._overflow(event)
+        return True
+
+    def _overflow(self, event):
+        if self.spill_dir:
+            try:
+                with self._lock:
+                    with open(self.spill_path, 'a') as spill:
+                        spill.write(json.dumps(event) + '\n')
+                return True
+            except (OSError, TypeError, ValueError):
+                log.exception('Unable to spill an automation event')
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 100 == 0:
+            log.warning('Automation events queue is full: %s events dropped', self.dropped)
+        return False
+
+    def _run(self):
+        while True:
+            try:
+                event = self.queue.get(timeout=IDLE_DELAY)
+            except queue.Empty:
+                self.recover()
+                continue
+            try:
+                self.send(*event)
+            finally:
+                self.queue.task_done()
+
+    def send(self, apikey, sib_type, data):
+        try:
+            AutomationClient(apikey, transport=self.transport).execute(sib_type, **data)
+        except Exception:
+            log.exception('Unable to send automation event "%s"', sib_type)
+
+    def recover(self):
+        '''Queue spilled events back, as long as there is room for them'''
+        if not self.spill_dir:
+            return
+        for path in glob.glob(os.path.join(self.spill_dir, SPILL_PATTERN)):
+            claimed = '{0}.{1}'.format(path, os.getpid())
+            try:
+                with self._lock:
+                    os.rename(path, claimed)
+            except OSError:
+                # Claimed by another process
+                continue
+            with open(claimed) as spill:
+                events = [json.loads(line) for line in spill if line.strip()]
+            os.remove(claimed)
+            for i, event in enumerate(events):
+                try:
+                    self.queue.put_nowait(tuple(event))
+                except queue.Full:
+                    for pending in events[i:]:
+                        self._overflow(tuple(pending))
+                    return
+
+    def flush(self, timeout=None):
+        '''Wait for queued events to be sent'''
+        if self._pid != os.getpid():
+            return
+        with self.queue.all_tasks_done:
+            if self.queue.unfinished_tasks:
+                self.queue.all_tasks_done.wait(timeout)
+
+
+class QueuedAutomationClient(AutomationClient):
+    '''
+    An automation client queuing events in an :class:`EventSink` (default to the process-wide one).
+
+    Methods return ``False`` instead of a response when the event has been dropped.
+    '''
+    def __init__(self, apikey, sink=None):
+        super().__init__(apikey)
+        self.sink = sink or get_sink()
+
+    def execute(self, sib_type, **data):
+        return self.sink.put(self.apikey, sib_type, data)
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_sink(**options):
+    '''
+    Get the process-wide event sink.
+
+    Options (see :class:`EventSink`) are only used on creation.
+    '''
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = EventSink(**options)
+                atexit.register(_sink.flush, 5)
+    return _sink
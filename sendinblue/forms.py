@@ -1,14 +1,19 @@
+import hashlib
+import json
+import threading
+
+from collections import OrderedDict
+
 from django import forms
-from django.forms import fields
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils.functional import cached_property, lazy
 from django.utils.translation import ugettext_lazy as _
 
 from wagtail.wagtailcore import blocks
-from wagtail.wagtailcore.models import Site
 from wagtail.wagtailembeds.blocks import EmbedBlock
 from wagtail.wagtailimages.blocks import ImageChooserBlock
 
-from .client import Client
+from . import attributes
 
 
 class SendInBlueAttributeBlock(blocks.FieldBlock):
@@ -18,18 +23,11 @@ class SendInBlueAttributeBlock(blocks.FieldBlock):
 
     @cached_property
     def field(self):
-        from .models import SendinBlueSettings
-        site = Site.objects.first()
-        settings = SendinBlueSettings.for_site(site)
-        api = Client(settings.apikey)
-        return forms.ChoiceField(choices=self.get_choices(api))
+        # Choices are only resolved (from the attributes registry) when rendered or validated
+        return forms.ChoiceField(choices=self.get_choices)
 
-    def get_choices(self, api):
-        data = api.get_attributes()
-        attributes = data['data']['normal_attributes']
-        names = [a['name'] for a in attributes]
-        names.insert(0, 'EMAIL')
-        return map(lambda n: (n, n), names)
+    def get_choices(self):
+        return [(n, n) for n in attributes.get_names()]
 
 
 class TextFieldBlock(blocks.StructBlock):
@@ -82,14 +80,57 @@ class FormBuilder(blocks.StreamBlock):
     embed = EmbedBlock()
 
 
+def get_fields(builder):
+    '''Extract ``(attribute, required)`` pairs of input fields from a form builder value'''
+    return [
+        (block.value['attribute'], block.value['required'])
+        for block in builder
+        if block.block_type in ('text_field', 'textarea')
+    ]
+
+
+def get_revision(builder):
+    '''A hash identifying a form builder value content'''
+    raw = getattr(builder, 'raw_text', None)
+    if raw is None:
+        raw = json.dumps(builder.stream_block.get_prep_value(builder), sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
 class SendInBlueDynamicForm(forms.Form):
     '''Dyanmic form built from a form builder'''
     def __init__(self, data=None, builder=None, **kwargs):
         super().__init__(data, **kwargs)
-        for block in builder:
-            if block.block_type == 'text_field':
-                field = dict((k, v.value) for k, v in block.value.bound_blocks.items())
-                self.fields[field['attribute']] = forms.CharField(required=field['required'])
-            elif block.block_type == 'textarea':
-                field = dict((k, v.value) for k, v in block.value.bound_blocks.items())
-                self.fields[field['attribute']] = forms.CharField(required=field['required'])
+        for attribute, required in get_fields(builder):
+            self.fields[attribute] = forms.CharField(required=required)
+
+
+_form_classes = {}
+_form_classes_lock = threading.Lock()
+
+
+def compile_form(config):
+    '''
+    Get the form class of a :class:`~sendinblue.models.FormConfig`.
+
+    Classes are built once per form definition revision and kept in the process memory
+    until the form is saved or deleted (see :func:`evict_form`).
+    '''
+    key = (config.pk, config.revision)
+    form_class = _form_classes.get(key)
+    if form_class is None:
+        form_fields = OrderedDict((attribute, forms.CharField(required=required))
+                                  for attribute, required in config.fields)
+        form_class = type(str('SendInBlueForm{0}'.format(config.pk)), (forms.Form, ), form_fields)
+        with _form_classes_lock:
+            for previous in [k for k in _form_classes if k[0] == config.pk]:
+                del _form_classes[previous]
+            _form_classes[key] = form_class
+    return form_class
+
+
+def evict_form(pk):
+    '''Drop the compiled form classes of a form'''
+    with _form_classes_lock:
+        for key in [k for k in _form_classes if k[0] == pk]:
+            del _form_classes[key]
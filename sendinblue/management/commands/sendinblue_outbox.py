@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from sendinblue.outbox import get_dispatcher
+
+
+class Command(BaseCommand):
+    help = 'Perform the SendInBlue operations recorded in the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=None,
+                            help='Maximum number of operations to perform per run')
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='Number of operations locked and performed at once')
+        parser.add_argument('--watch', action='store_true', default=False,
+                            help='Keep polling the outbox')
+        parser.add_argument('--interval', type=float, default=5,
+                            help='Polling interval in seconds (with --watch)')
+
+    def handle(self, *args, **options):
+        dispatcher = get_dispatcher()
+        if options['batch_size']:
+            dispatcher.batch_size = options['batch_size']
+        while True:
+            count = dispatcher.dispatch(limit=options['limit'])
+            if options['verbosity'] > 1 or (count and not options['watch']):
+                self.stdout.write('Performed {0} operation(s)'.format(count))
+            if not options['watch']:
+                break
+            if not count:
+                time.sleep(options['interval'])
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from sendinblue.queue import get_backend
+
+
+class Command(BaseCommand):
+    help = 'Process queued SendInBlue form submissions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=None,
+                            help='Maximum number of submissions to process per run')
+        parser.add_argument('--watch', action='store_true', default=False,
+                            help='Keep polling the queue')
+        parser.add_argument('--interval', type=float, default=5,
+                            help='Polling interval in seconds (with --watch)')
+
+    def handle(self, *args, **options):
+        backend = get_backend()
+        while True:
+            count = backend.drain(limit=options['limit'])
+            if options['verbosity'] > 1 or (count and not options['watch']):
+                self.stdout.write('Processed {0} submission(s)'.format(count))
+            if not options['watch']:
+                break
+            if not count:
+                time.sleep(options['interval'])
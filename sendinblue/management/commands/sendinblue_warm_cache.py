@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from wagtail.wagtailcore.models import Site
+
+from sendinblue import attributes, dashboard
+from sendinblue.client import Client
+from sendinblue.models import SendinBlueSettings
+
+
+class Command(BaseCommand):
+    help = 'Pre-warm the SendInBlue dashboard and attributes cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--site', type=int, action='append', dest='sites', default=None,
+                            help='Only warm the cache of the given site ID (can be repeated)')
+
+    def handle(self, *args, **options):
+        sites = Site.objects.all()
+        if options['sites']:
+            sites = sites.filter(pk__in=options['sites'])
+        for site in sites:
+            settings = SendinBlueSettings.for_site(site)
+            if not settings.apikey:
+                continue
+            dashboard.warm(Client(settings.apikey))
+            attributes.refresh(site)
+            if options['verbosity'] > 0:
+                self.stdout.write('Warmed cache for {0}'.format(site))
@@ -0,0 +1,69 @@
+'''
+Server-side page tracking.
+
+Sends an automation ``page`` event for each successful ``GET`` request
+on the URLs matching one of the ``SENDINBLUE_PAGE_TRACKING['patterns']`` regular expressions::
+
+    SENDINBLUE_PAGE_TRACKING = {
+        'patterns': [r'^/blog/', r'^/offers/'],
+        'sample': 0.1,  # Track 10% of the pages views
+        'dedup': 30 * 60,  # Track a page once per session every 30 minutes
+    }
+
+Events are queued (see :mod:`sendinblue.events`) so responses are never delayed by SendInBlue.
+Requires the Wagtail ``SiteMiddleware`` and user tracking to be enabled in the site settings.
+'''
+import random
+import re
+
+from django.utils.deprecation import MiddlewareMixin
+
+from . import cache
+from .events import QueuedAutomationClient, get_sink
+from .models import SendinBlueSettings
+from .utils import setting
+
+
+class PageTrackingMiddleware(MiddlewareMixin):
+    '''Track pages views with SendInBlue automation'''
+    def __init__(self, get_response=None):
+        super().__init__(get_response)
+        config = setting('PAGE_TRACKING', {})
+        self.patterns = [re.compile(pattern) for pattern in config.get('patterns', [])]
+        self.sample = config.get('sample', 1)
+        self.dedup = config.get('dedup')
+
+    def process_response(self, request, response):
+        if self.should_track(request, response):
+            settings = SendinBlueSettings.for_request(request)
+            if settings.automation and settings.track_users and self.is_first_view(request):
+                self.track(request, settings)
+        return response
+
+    def should_track(self, request, response):
+        return (request.method == 'GET' and response.status_code == 200
+                and getattr(request, 'site', None) is not None
+                and any(pattern.match(request.path) for pattern in self.patterns)
+                and random.random() < self.sample)
+
+    def is_first_view(self, request):
+        '''Whether the page has not been tracked for the current session since ``dedup`` seconds'''
+        session_key = getattr(getattr(request, 'session', None), 'session_key', None)
+        if not self.dedup or not session_key:
+            return True
+        key = cache.make_key('page', cache.digest(session_key), cache.digest(request.path))
+        return cache.get_cache().add(key, True, self.dedup)
+
+    def track(self, request, settings):
+        data = {
+            'url': request.build_absolute_uri(),
+            'referrer': request.META.get('HTTP_REFERER'),
+        }
+        session = getattr(request, 'session', None)
+        if session is not None and session.session_key:
+            data['session_id'] = session.session_key
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated and getattr(user, 'email', None):
+            data['email_id'] = user.email
+        automation = QueuedAutomationClient(settings.automation, get_sink(**setting('EVENTS', {})))
+        automation.page(request.path, **dict((k, v) for k, v in data.items() if v))
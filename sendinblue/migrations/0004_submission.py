@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-17 09:12
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtailcore', '0029_unicode_slugfield_dj19'),
+        ('sendinblue', '0003_send_mails'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SendInBlueSubmission',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=255, verbose_name='Email')),
+                ('data', models.TextField(default='{}', verbose_name='Data')),
+                ('session_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='Session ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', max_length=8, verbose_name='Status')),
+                ('steps', models.TextField(default='[]', verbose_name='Performed steps')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, verbose_name='Last error')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+                ('next_attempt', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Next attempt')),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submissions', to='sendinblue.SendInBlueForm')),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='wagtailcore.Site')),
+            ],
+            options={
+                'verbose_name_plural': 'SendInBlue Submissions',
+                'verbose_name': 'SendInBlue Submission',
+                'ordering': ('next_attempt',),
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-17 14:05
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtailcore', '0029_unicode_slugfield_dj19'),
+        ('sendinblue', '0004_submission'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SendInBlueOperation',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True, verbose_name='Idempotency key')),
+                ('method', models.CharField(max_length=64, verbose_name='Method')),
+                ('automation', models.BooleanField(default=False, verbose_name='Automation event')),
+                ('arguments', models.TextField(default='{}', verbose_name='Arguments')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', max_length=8, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, verbose_name='Last error')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+                ('next_attempt', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Next attempt')),
+                ('depends_on', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dependents', to='sendinblue.SendInBlueOperation')),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='wagtailcore.Site')),
+            ],
+            options={
+                'verbose_name_plural': 'SendInBlue Operations',
+                'verbose_name': 'SendInBlue Operation',
+                'ordering': ('pk',),
+            },
+        ),
+    ]
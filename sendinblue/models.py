@@ -1,9 +1,11 @@
+import copy
+import json
 import re
+import time
 
 from django.db import models
 from django.core.exceptions import ValidationError
-from django.template.loader import render_to_string
-from django.utils.safestring import mark_safe
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from modelcluster.models import ClusterableModel
@@ -17,9 +19,11 @@ from wagtail.wagtailsnippets.blocks import SnippetChooserBlock
 from wagtail.wagtailsnippets.models import register_snippet
 from wagtail.wagtailadmin.edit_handlers import FieldPanel, MultiFieldPanel, InlinePanel, FieldRowPanel, StreamFieldPanel
 
-from .utils import mark_safe_lazy
+from . import cache
+from .utils import mark_safe_lazy, setting
 from .widgets import ListSelect, TemplateSelect
-from .forms import FormBuilder
+from .forms import FormBuilder, get_fields, get_revision
+from .rendering import render_form, render_iframe
 
 
 API_KEY_HELP = _('You can retrieve your SendInBlue API Key <a target="_blank" href="%s">here</a>')
@@ -27,6 +31,12 @@ API_KEY_URL = 'https://account.sendinblue.com/advanced/api'
 AUTOMATION_KEY_HELP = _('You can retrieve your SendInBlue Automation API Key <a target="_blank" href="%s">here</a>')
 AUTOMATION_KEY_URL = 'https://automation.sendinblue.com/parameters'
 
+#: Default form configuration cache lifetime in seconds
+FORM_CONFIG_TTL = 24 * 60 * 60
+
+#: Process-local settings, by site id: (version, instance, expiration timestamp)
+_settings = {}
+
 RE_IFRAME = re.compile(r'\<iframe width="(?P<width>\d+)" height="(?P<height>\d+)" src="(?P<src>[^\"]+)".*\>\<\/iframe\>')
 
 
@@ -47,6 +57,43 @@ class SendinBlueSettings(BaseSetting):
     notify_email = models.EmailField(_('Notification email'), max_length=255, null=True, blank=True,
                                      help_text=_('Notification mail will be sent to this email'))
 
+    @classmethod
+    def for_site(cls, site):
+        '''
+        Get a site settings.
+
+        Settings are kept in the process memory until saved
+        (the version is shared by all processes through the Django cache)
+        and for at most :data:`~sendinblue.cache.LOCAL_TTL` seconds.
+        '''
+        version = cache.generation(cls.namespace(site.pk))
+        now = time.time()
+        entry = _settings.get(site.pk)
+        if entry is None or entry[0] != version or entry[2] < now:
+            instance = super().for_site(site)
+            instance._version = version
+            entry = _settings[site.pk] = (version, instance, now + cache.LOCAL_TTL)
+        # Never share a mutable instance (ie. with the settings edit form)
+        return copy.copy(entry[1])
+
+    @classmethod
+    def for_request(cls, request):
+        '''Get the current site settings, memoized for the request lifetime'''
+        if not hasattr(request, '_sendinblue_settings'):
+            request._sendinblue_settings = cls.for_site(request.site)
+        return request._sendinblue_settings
+
+    @staticmethod
+    def namespace(site_id):
+        return 'settings:{0}'.format(site_id)
+
+    @property
+    def version(self):
+        '''The settings version, changed on each save'''
+        if hasattr(self, '_version'):
+            return self._version
+        return cache.generation(self.namespace(self.site_id))
+
     panels = [
         FieldPanel('apikey'),
         MultiFieldPanel([
@@ -141,6 +188,155 @@ class SendInBlueForm(models.Model):
         verbose_name = _('SendInBlue Form')
         verbose_name_plural = _('SendInBlue Forms')
 
+    @classmethod
+    def get_config(cls, pk):
+        '''
+        Get a form submission configuration, from cache if possible.
+
+        :rtype: FormConfig
+        :raises SendInBlueForm.DoesNotExist: if there is no such form
+        '''
+        key = cache.make_key('form', pk)
+        config = cache.get_cache().get(key)
+        if config is None:
+            config = FormConfig.from_form(cls.objects.get(pk=pk))
+            cache.get_cache().set(key, config, cache.local_ttl(setting('FORM_CONFIG_TTL', FORM_CONFIG_TTL)))
+        return config
+
+    @classmethod
+    def invalidate_config(cls, pk):
+        cache.get_cache().delete(cache.make_key('form', pk))
+
+
+class FormConfig(object):
+    '''
+    A cacheable snapshot of a :class:`SendInBlueForm` submission configuration.
+
+    It exposes the same attributes as the form itself, plus its input ``fields``
+    (as ``(attribute, required)`` pairs) and its definition ``revision``.
+    '''
+    ATTRIBUTES = ('pk', 'name', 'target_list', 'send_event', 'notify_template', 'confirm_template',
+                  'thankyou_title', 'thankyou_text')
+
+    def __init__(self, **kwargs):
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def from_form(cls, sib_form):
+        config = cls(**dict((name, getattr(sib_form, name)) for name in cls.ATTRIBUTES))
+        config.thankyou_title = str(config.thankyou_title)
+        config.fields = get_fields(sib_form.definition)
+        config.revision = get_revision(sib_form.definition)
+        return config
+
+
+class SendInBlueSubmission(models.Model):
+    '''A validated form submission waiting for its SendInBlue side effects'''
+    PENDING = 'pending'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = (
+        (PENDING, _('Pending')),
+        (DONE, _('Done')),
+        (FAILED, _('Failed')),
+    )
+
+    form = models.ForeignKey(SendInBlueForm, on_delete=models.CASCADE, related_name='submissions')
+    site = models.ForeignKey('wagtailcore.Site', on_delete=models.CASCADE, related_name='+')
+    email = models.EmailField(_('Email'), max_length=255)
+    data = models.TextField(_('Data'), default='{}')
+    session_id = models.CharField(_('Session ID'), max_length=255, null=True, blank=True)
+    status = models.CharField(_('Status'), max_length=8, choices=STATUSES, default=PENDING, db_index=True)
+    steps = models.TextField(_('Performed steps'), default='[]')
+    attempts = models.PositiveIntegerField(_('Attempts'), default=0)
+    last_error = models.TextField(_('Last error'), blank=True)
+    created = models.DateTimeField(_('Created'), auto_now_add=True)
+    next_attempt = models.DateTimeField(_('Next attempt'), default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = _('SendInBlue Submission')
+        verbose_name_plural = _('SendInBlue Submissions')
+        ordering = ('next_attempt', )
+
+    @property
+    def payload(self):
+        return json.loads(self.data)
+
+    @payload.setter
+    def payload(self, value):
+        self.data = json.dumps(value)
+
+    @property
+    def done(self):
+        return json.loads(self.steps)
+
+    @done.setter
+    def done(self, value):
+        self.steps = json.dumps(value)
+
+    def prepare(self):
+        '''Build the remaining side effects of this submission, see :func:`~sendinblue.pipeline.get_steps`'''
+        from .pipeline import get_steps
+        settings = SendinBlueSettings.for_site(self.site)
+        sib_form = SendInBlueForm.get_config(self.form_id)
+        return get_steps(sib_form, settings, self.email, self.payload, self.session_id, done=self.done)
+
+    def process(self, steps=None):
+        '''
+        Perform the remaining side effects of this submission.
+
+        :param OrderedDict steps: The steps built beforehand with :meth:`prepare`, if any
+        '''
+        from .pipeline import process
+        settings = SendinBlueSettings.for_site(self.site)
+        sib_form = SendInBlueForm.get_config(self.form_id)
+        return process(sib_form, settings, self.email, self.payload, self.session_id, done=self.done, steps=steps)
+
+
+class SendInBlueOperation(models.Model):
+    '''An outbound SendInBlue call recorded in the outbox, see :mod:`sendinblue.outbox`'''
+    PENDING = 'pending'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = (
+        (PENDING, _('Pending')),
+        (DONE, _('Done')),
+        (FAILED, _('Failed')),
+    )
+
+    key = models.CharField(_('Idempotency key'), max_length=64, unique=True)
+    site = models.ForeignKey('wagtailcore.Site', on_delete=models.CASCADE, related_name='+')
+    method = models.CharField(_('Method'), max_length=64)
+    automation = models.BooleanField(_('Automation event'), default=False)
+    arguments = models.TextField(_('Arguments'), default='{}')
+    depends_on = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True,
+                                   related_name='dependents')
+    status = models.CharField(_('Status'), max_length=8, choices=STATUSES, default=PENDING, db_index=True)
+    attempts = models.PositiveIntegerField(_('Attempts'), default=0)
+    last_error = models.TextField(_('Last error'), blank=True)
+    created = models.DateTimeField(_('Created'), auto_now_add=True)
+    next_attempt = models.DateTimeField(_('Next attempt'), default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = _('SendInBlue Operation')
+        verbose_name_plural = _('SendInBlue Operations')
+        ordering = ('pk', )
+
+    @property
+    def operation(self):
+        from .pipeline import Operation
+        return Operation(self.method, json.loads(self.arguments), self.automation)
+
+    @operation.setter
+    def operation(self, value):
+        self.method = value.method
+        self.arguments = json.dumps(value.arguments)
+        self.automation = value.automation
+
 
 class SendInBlueFormBlock(SnippetChooserBlock):
     def __init__(self, **kwargs):
@@ -152,45 +348,33 @@ class SendInBlueFormBlock(SnippetChooserBlock):
         template = 'sendinblue/blocks/form.html'
 
     def render(self, value, context=None):
-        """
-        Add `page_context` kwarg to `get_context`.
-
-        Copy-pasted from 'wagtailcore.blocks.base'
-        Temporary fix until https://github.com/torchbox/wagtail/issues/2824
-        is adressed
-        """
-        template = getattr(self.meta, 'template', None)
-        if not template:
-            return self._render_basic_with_context(value, context=context)
-
-        if context is None:
-            new_context = self.get_context(value)
-        else:
-            new_context = dict(context)
-            new_context.update(self.get_context(value, page_context=context))
-
-        return mark_safe(render_to_string(template, new_context))
-
-    def get_context(self, value, page_context=None, **kwargs):
-        context = super().get_context(value)
-        page_context.update(context)
-        page_context['form'] = value
-        return page_context
+        '''Render the cached form markup, filling in the request CSRF token'''
+        if value is None:
+            return ''
+        return render_form(self.meta.template, value, context)
 
 
 class IFrameFormBlock(blocks.CharBlock):
-    def get_context(self, value):
-        context = super(IFrameFormBlock, self).get_context(value)
+    @staticmethod
+    def parse(value):
+        '''Extract the iframe attributes from an embed code or an URL'''
         m = RE_IFRAME.match(value)
         if m:
-            context.update(iframe=m.groupdict())
-        else:
-            context.update(iframe={
-                'src': value,
-                'width': 540,
-                'height': 300,
-            })
+            return m.groupdict()
+        return {
+            'src': value,
+            'width': 540,
+            'height': 300,
+        }
+
+    def get_context(self, value):
+        context = super(IFrameFormBlock, self).get_context(value)
+        context.update(iframe=self.parse(value))
         return context
 
+    def render(self, value, context=None):
+        '''The markup only depends on the embed code: render it once'''
+        return render_iframe(self.meta.template, value)
+
     class Meta:
         template = 'sendinblue/blocks/iframe-form.html'
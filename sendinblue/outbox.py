@@ -0,0 +1,210 @@
+'''
+Durable outbox of SendInBlue operations.
+
+Each outbound call is first recorded as a :class:`~sendinblue.models.SendInBlueOperation`
+with an idempotency key (recording the same key twice is a no-op),
+then performed by a :class:`Dispatcher`, usually from the ``sendinblue_outbox`` command::
+
+    operation = Operation('send_transactional_template', {'id': 12, 'to': email})
+    outbox.record(site, operation, key=order.reference)
+
+Dispatchers claim operations by batches for a lease, skipping the ones being claimed by others
+(on databases supporting ``SKIP LOCKED``), so many workers can drain the outbox in parallel
+and no lock is held while calling SendInBlue.
+Operations are delivered at least once: a call timing out after reaching SendInBlue is performed again.
+'''
+import hashlib
+import logging
+import uuid
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from wagtail.wagtailcore.models import Site
+
+from .client import Client, AutomationClient
+from .pipeline import get_operations
+from .timeouts import bind, deadline
+from .utils import setting
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 10
+DEFAULT_RETRY_DELAY = 60
+#: Default maximum duration of a batch in seconds
+DEFAULT_DEADLINE = 60
+#: Default number of seconds claimed operations are reserved to their worker
+DEFAULT_LEASE = 5 * 60
+DEFAULT_WORKERS = 10
+
+
+def make_key(*parts):
+    '''Derive an idempotency key from some values'''
+    return hashlib.sha1(':'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def record(site, operation, key=None, depends_on=None):
+    '''
+    Record an operation in the outbox.
+
+    :param Site site: The site whose settings are used to perform the operation
+    :param Operation operation: The :class:`~sendinblue.pipeline.Operation` to perform
+    :param str key: The idempotency key (default to a random one)
+    :param SendInBlueOperation depends_on: An operation which needs to succeed first
+    :returns: the recorded operation, or the existing one with the same key
+    :rtype: SendInBlueOperation
+    '''
+    from .models import SendInBlueOperation
+    instance = SendInBlueOperation(key=key or uuid.uuid4().hex, site=site, depends_on=depends_on)
+    instance.operation = operation
+    try:
+        with transaction.atomic():
+            instance.save()
+    except IntegrityError:
+        return SendInBlueOperation.objects.get(key=instance.key)
+    return instance
+
+
+def record_submission(sib_form, site, email, data, session_id=None, done=(), key=None):
+    '''
+    Record all the side effects of a form submission.
+
+    :param iterable done: Names of the steps already performed
+    :param str key: The submission idempotency key, each side effect key is derived from it
+    :returns: the recorded operations by name
+    :rtype: dict
+    '''
+    from .models import SendinBlueSettings
+    settings = SendinBlueSettings.for_site(site)
+    key = key or uuid.uuid4().hex
+    records = {}
+    with transaction.atomic():
+        for name, operation in get_operations(sib_form, settings, email, data, session_id).items():
+            if name in done:
+                continue
+            depends_on = next((records[r] for r in operation.requires if r in records), None)
+            records[name] = record(site, operation, make_key(key, name), depends_on)
+    return records
+
+
+def lock(queryset):
+    '''Lock the rows of a queryset, skipping the ones already locked if possible'''
+    if getattr(connections[queryset.db].features, 'has_select_for_update_skip_locked', False):
+        return queryset.select_for_update(skip_locked=True)
+    return queryset.select_for_update()
+
+
+class Dispatcher(object):
+    '''
+    Perform outbox operations.
+
+    Operations of a batch are performed concurrently on a dedicated thread pool.
+
+    :param int batch_size: Number of operations locked and performed at once
+    :param int max_attempts: Number of attempts before marking an operation as failed
+    :param int retry_delay: Delay in seconds before the first retry, doubled for each subsequent attempt
+    :param int deadline: Maximum duration of a batch in seconds
+    :param int workers: Number of operations performed at once
+    :param int lease: Number of seconds claimed operations are reserved to their worker,
+        after which operations claimed by a crashed worker are performed again (longer than ``deadline``)
+    '''
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 retry_delay=DEFAULT_RETRY_DELAY, deadline=DEFAULT_DEADLINE, workers=DEFAULT_WORKERS,
+                 lease=DEFAULT_LEASE):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.deadline = deadline
+        self.workers = workers
+        self.lease = lease
+
+    def pending(self):
+        '''Operations ready to be performed: due and whose dependency succeeded'''
+        from .models import SendInBlueOperation
+        blocking = SendInBlueOperation.objects.exclude(status=SendInBlueOperation.DONE).values('pk')
+        return SendInBlueOperation.objects.filter(
+            status=SendInBlueOperation.PENDING, next_attempt__lte=timezone.now()
+        ).exclude(depends_on__in=blocking)
+
+    def dispatch(self, limit=None):
+        '''
+        Perform pending operations by batches.
+
+        :param int limit: Maximum number of operations to perform
+        :returns: the number of performed operations
+        '''
+        count = 0
+        while limit is None or count < limit:
+            size = self.batch_size if limit is None else min(self.batch_size, limit - count)
+            operations = self.claim(size)
+            if not operations:
+                break
+            self.perform(operations)
+            count += len(operations)
+        return count
+
+    def claim(self, size):
+        '''
+        Reserve some pending operations to this worker, skipping the ones being claimed by others.
+
+        Attempts are counted on claim, so operations interrupted by a crash still end up failing.
+        '''
+        with transaction.atomic():
+            operations = list(lock(self.pending())[:size])
+            if operations:
+                expires = timezone.now() + timedelta(seconds=self.lease)
+                self.pending().model.objects.filter(pk__in=[o.pk for o in operations]).update(
+                    next_attempt=expires, attempts=F('attempts') + 1)
+                for operation in operations:
+                    operation.next_attempt = expires
+                    operation.attempts += 1
+        return operations
+
+    def perform(self, operations):
+        '''Perform a batch of claimed operations and save their outcome, outside of any transaction'''
+        from .models import SendinBlueSettings
+        # Operations claimed more times than allowed were interrupted during their last attempt
+        for operation in [o for o in operations if o.attempts > self.max_attempts]:
+            self.settle(operation, RuntimeError('Interrupted during its last attempt'))
+        operations = [o for o in operations if o.attempts <= self.max_attempts]
+        if not operations:
+            return
+        sites = Site.objects.in_bulk(set(o.site_id for o in operations))
+        settings = dict((pk, SendinBlueSettings.for_site(site)) for pk, site in sites.items())
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(operations))) as executor:
+            with deadline(self.deadline):
+                futures = [(o, executor.submit(bind(self.call), o.operation, settings[o.site_id]))
+                           for o in operations]
+            for operation, future in futures:
+                try:
+                    self.settle(operation, future.exception())
+                except Exception:
+                    # Performed again once its lease expires
+                    log.exception('Unable to save the outcome of operation %s', operation.key)
+
+    def call(self, operation, settings):
+        return operation.perform(Client(settings.apikey), AutomationClient(settings.automation))
+
+    def settle(self, operation, error):
+        if error is None:
+            operation.status = operation.DONE
+            operation.last_error = ''
+        else:
+            operation.last_error = repr(error)
+            if operation.attempts >= self.max_attempts:
+                operation.status = operation.FAILED
+                log.error('Operation %s failed after %s attempts: %r', operation.key, operation.attempts, error)
+                operation.dependents.update(status=operation.FAILED, last_error='Dependency failed')
+            else:
+                delay = self.retry_delay * 2 ** (operation.attempts - 1)
+                operation.next_attempt = timezone.now() + timedelta(seconds=delay)
+        operation.save(update_fields=['status', 'last_error', 'next_attempt'])
+
+
+def get_dispatcher():
+    '''Instanciate a dispatcher configured with ``SENDINBLUE_OUTBOX``'''
+    return Dispatcher(**setting('OUTBOX', {}))
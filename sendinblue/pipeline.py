@@ -0,0 +1,291 @@
+'''
+Form submission processing.
+
+A submission is processed as a small dependency graph of named steps,
+each one performing a single SendInBlue side effect.
+Independent steps are run concurrently on a bounded thread pool (see :func:`get_executor`).
+
+Once processed, results are reported to the ``after_sendinblue_submission`` hooks::
+
+    @hooks.register('after_sendinblue_submission')
+    def log_submission(sib_form, email, results):
+        for result in results.values():
+            ...
+'''
+import logging
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+
+from wagtail.wagtailcore import hooks
+
+from .batch import get_batcher
+from .client import Client, AutomationClient, check
+from .events import QueuedAutomationClient, get_sink
+from .timeouts import bind, deadline, remaining
+from .utils import setting
+
+log = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_BACKGROUND_WORKERS = 4
+#: Default maximum duration of a submission processing in seconds
+DEFAULT_DEADLINE = 20
+
+_executors = {}
+_executor_lock = threading.Lock()
+
+
+class InlineOverflowExecutor(object):
+    '''
+    A thread pool running tasks in the calling thread when all its workers are busy,
+    so steps never wait in a queue behind other submissions.
+    '''
+    def __init__(self, max_workers):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_workers)
+
+    def submit(self, fn, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        future = self.executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda f: self._slots.release())
+        return future
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait)
+
+
+def _get_executor(name, factory):
+    executor = _executors.get(name)
+    if executor is None:
+        with _executor_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = _executors[name] = factory()
+    return executor
+
+
+def get_executor():
+    '''
+    Get the process-wide submission steps thread pool, sized by ``SENDINBLUE_WORKERS``.
+
+    Steps submitted while all workers are busy run in the calling thread:
+    size it after the number of concurrent requests each process serves.
+    '''
+    return _get_executor('submissions', lambda: InlineOverflowExecutor(setting('WORKERS', DEFAULT_WORKERS)))
+
+
+def get_background_executor():
+    '''
+    Get the process-wide thread pool of background tasks (cache refreshes, dashboard loading...),
+    sized by ``SENDINBLUE_BACKGROUND_WORKERS``.
+    '''
+    return _get_executor('background', lambda: ThreadPoolExecutor(
+        max_workers=setting('BACKGROUND_WORKERS', DEFAULT_BACKGROUND_WORKERS)))
+
+
+class SubmissionError(Exception):
+    '''
+    Raised when some submission steps failed.
+
+    :param dict errors: The exceptions raised by failed steps, by step name
+    :param list done: The names of the successful steps
+    '''
+    def __init__(self, errors, done):
+        self.errors = errors
+        self.done = done
+        super().__init__(', '.join('{0}: {1!r}'.format(name, e) for name, e in errors.items()))
+
+
+class Step(object):
+    '''
+    A single side effect.
+
+    :param callable func: The function performing the side effect
+    :param list requires: Names of the steps which need to succeed first
+    '''
+    def __init__(self, func, requires=()):
+        self.func = func
+        self.requires = tuple(requires)
+
+
+class StepResult(object):
+    '''The outcome of a step'''
+    def __init__(self, name, value=None, error=None, skipped=False):
+        self.name = name
+        self.value = value
+        self.error = error
+        self.skipped = skipped
+
+    @property
+    def ok(self):
+        return self.error is None and not self.skipped
+
+    def __repr__(self):
+        status = 'skipped' if self.skipped else 'error' if self.error else 'ok'
+        return '<StepResult {0}: {1}>'.format(self.name, status)
+
+
+class Operation(object):
+    '''
+    A single SendInBlue call, described with serializable values.
+
+    :param str method: The :class:`~sendinblue.client.Client` endpoint method,
+        or the event type for automation events
+    :param dict arguments: The call keyword arguments
+    :param bool automation: Whether this is an automation event
+    :param list requires: Names of the operations which need to succeed first
+    '''
+    def __init__(self, method, arguments, automation=False, requires=()):
+        self.method = method
+        self.arguments = arguments
+        self.automation = automation
+        self.requires = tuple(requires)
+
+    def perform(self, api, automation=None):
+        if self.automation:
+            return automation.execute(self.method, **self.arguments)
+        return check(getattr(api, self.method)(**self.arguments))
+
+
+def get_operations(sib_form, settings, email, data, session_id=None):
+    '''
+    Describe the side effects of a form submission.
+
+    :returns: an ordered mapping of :class:`Operation` by name
+    :rtype: OrderedDict
+    '''
+    operations = OrderedDict()
+    operations['contact'] = Operation('create_update_user', {'email': email, 'attributes': data})
+    if sib_form.target_list:
+        operations['list'] = Operation('add_users_list', {'id': sib_form.target_list, 'users': [email]},
+                                       requires=['contact'])
+
+    data_formated = dict((k, v.replace('\n', '<br/>')) for k, v in data.items())
+    data_formated.update(EMAIL=email)
+
+    if sib_form.confirm_template:
+        operations['confirm'] = Operation('send_transactional_template', {
+            'id': sib_form.confirm_template, 'to': email, 'attr': data_formated})
+    if sib_form.notify_template and settings.notify_email:
+        operations['notify'] = Operation('send_transactional_template', {
+            'id': sib_form.notify_template, 'to': settings.notify_email, 'attr': data_formated})
+
+    if settings.automation:
+        if settings.track_users or sib_form.send_event:
+            operations['identify'] = Operation('identify', dict(data, session_id=session_id, email_id=email),
+                                               automation=True)
+        if sib_form.send_event:
+            operations['track'] = Operation('track', {
+                'sib_name': sib_form.send_event, 'session_id': session_id, 'email_id': email}, automation=True)
+
+    return operations
+
+
+def get_steps(sib_form, settings, email, data, session_id=None, done=()):
+    '''
+    Build the side effects of a form submission.
+
+    With ``SENDINBLUE_CONTACT_BATCH``, the contact is handed to the batcher right away:
+    build the steps of many submissions before running them to import their contacts together.
+
+    :param iterable done: Names of steps already performed by a previous attempt, to be skipped
+    :returns: an ordered mapping of :class:`Step` by name
+    :rtype: OrderedDict
+    '''
+    api = Client(settings.apikey)
+    automation = None
+    if settings.automation:
+        events = setting('EVENTS')
+        if events is None:
+            automation = AutomationClient(settings.automation)
+        else:
+            # Events are sent in the background: steps only report whether they have been queued
+            automation = QueuedAutomationClient(settings.automation, get_sink(**events))
+
+    operations = get_operations(sib_form, settings, email, data, session_id)
+    steps = OrderedDict((name, Step(partial(operation.perform, api, automation), operation.requires))
+                        for name, operation in operations.items() if name not in done)
+
+    batch = setting('CONTACT_BATCH')
+    if batch and 'contact' in steps:
+        # The contact is imported into the target list with other pending contacts
+        contact = get_batcher(settings.apikey, **batch).upsert(email, data, sib_form.target_list)
+        steps['contact'] = Step(lambda: contact.result(remaining()))
+        steps.pop('list', None)
+
+    return steps
+
+
+def run(steps, executor=None):
+    '''
+    Run steps as a dependency graph.
+
+    Each step is submitted as soon as all its requirements succeeded
+    (requirements missing from ``steps`` are considered satisfied).
+    A step whose requirement failed is skipped.
+
+    :param OrderedDict steps: :class:`Step` instances by name
+    :returns: a :class:`StepResult` by step name
+    :rtype: OrderedDict
+    '''
+    executor = executor or get_executor()
+    results = OrderedDict()
+    pending = OrderedDict(steps)
+    running = {}
+    while pending or running:
+        for name, step in list(pending.items()):
+            requires = [r for r in step.requires if r in steps]
+            if any(r not in results for r in requires):
+                continue
+            del pending[name]
+            if all(results[r].ok for r in requires):
+                running[executor.submit(bind(step.func))] = name
+            else:
+                results[name] = StepResult(name, skipped=True)
+        if not running:
+            continue
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in finished:
+            name = running.pop(future)
+            error = future.exception()
+            results[name] = StepResult(name, error=error) if error else StepResult(name, future.result())
+    return OrderedDict((name, results[name]) for name in steps)
+
+
+def process(sib_form, settings, email, data, session_id=None, done=(), steps=None):
+    '''
+    Perform all the SendInBlue side effects of a form submission.
+
+    All calls share the ``submission`` entry of ``SENDINBLUE_DEADLINES`` (in seconds).
+
+    :param iterable done: Names of steps already performed by a previous attempt, to be skipped
+    :param OrderedDict steps: The steps built beforehand with :func:`get_steps`, if any
+    :returns: the names of all successful steps
+    :raises SubmissionError: if a step failed
+    '''
+    if steps is None:
+        steps = get_steps(sib_form, settings, email, data, session_id, done)
+
+    with deadline(setting('DEADLINES', {}).get('submission', DEFAULT_DEADLINE)):
+        results = run(steps)
+
+    for fn in hooks.get_hooks('after_sendinblue_submission'):
+        try:
+            fn(sib_form, email, results)
+        except Exception:
+            log.exception('Hook %r failed on submission of form "%s"', fn, sib_form)
+
+    done = list(done) + [name for name, result in results.items() if result.ok]
+    errors = OrderedDict((name, result.error) for name, result in results.items() if result.error)
+    if errors:
+        raise SubmissionError(errors, done)
+    return done
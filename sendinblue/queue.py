@@ -0,0 +1,238 @@
+'''
+Pluggable form submission queues.
+
+The backend is selected with the ``SENDINBLUE_QUEUE_BACKEND`` setting
+and configured with ``SENDINBLUE_QUEUE_OPTIONS``.
+'''
+import json
+import logging
+import uuid
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from . import cache, pipeline
+from .client import TRANSIENT_ERRORS
+from .utils import setting
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = 'sendinblue.queue.SyncBackend'
+#: Default number of seconds during which identical submissions are ignored
+DEDUP_WINDOW = 60
+DEFAULT_BATCH_SIZE = 50
+#: Default number of seconds a worker has to process its claimed submissions
+DEFAULT_LEASE = 5 * 60
+
+
+class BaseBackend(object):
+    '''Base class for submission queue backends'''
+    def __init__(self, **options):
+        self.options = options
+
+    def enqueue(self, sib_form, site, email, data, session_id=None, done=(), key=None):
+        '''
+        Schedule the side effects of a validated form submission.
+
+        :param iterable done: Names of the steps already performed
+        :param str key: The submission idempotency key, if the backend supports it
+        :returns: ``False`` if the submission failed
+        '''
+        raise NotImplementedError
+
+    def drain(self, limit=None):
+        '''
+        Process queued submissions.
+
+        :param int limit: Maximum number of submissions to process
+        :returns: the number of processed submissions
+        '''
+        return 0
+
+
+class SyncBackend(BaseBackend):
+    '''
+    Process submissions immediately, inside the request.
+
+    :param str fallback: An optional backend (dotted path) queueing submissions
+        which failed because SendInBlue is unavailable (ie. a circuit is open), to be retried later
+    :param dict fallback_options: The fallback backend options
+    '''
+    def __init__(self, fallback=None, fallback_options=None, **options):
+        super().__init__(**options)
+        self.fallback = import_string(fallback)(**(fallback_options or {})) if fallback else None
+
+    def enqueue(self, sib_form, site, email, data, session_id=None, done=(), key=None):
+        from .models import SendinBlueSettings
+        settings = SendinBlueSettings.for_site(site)
+        try:
+            pipeline.process(sib_form, settings, email, data, session_id, done)
+        except pipeline.SubmissionError as e:
+            if self.fallback and all(isinstance(error, TRANSIENT_ERRORS) for error in e.errors.values()):
+                log.warning('SendInBlue is unavailable, queueing submission of form "%s": %s', sib_form, e)
+                return self.fallback.enqueue(sib_form, site, email, data, session_id, e.done, key)
+            log.exception('Unable to process submission of form "%s"', sib_form)
+            return False
+
+
+class DatabaseBackend(BaseBackend):
+    '''
+    Store submissions in the database to be processed by a worker.
+
+    Workers claim pending submissions by batches for a ``lease`` duration:
+    no lock is held while calling SendInBlue and submissions claimed by
+    a crashed worker are processed again once their lease expires.
+    Attempts are counted on claim, so submissions interrupted by crashes still end up failing.
+
+    :param int max_attempts: Number of attempts before marking a submission as failed
+    :param int retry_delay: Delay in seconds before the first retry,
+        doubled for each subsequent attempt
+    :param int batch_size: Number of submissions claimed at once
+    :param int lease: Number of seconds a claimed submission is reserved to its worker
+    '''
+    def __init__(self, max_attempts=5, retry_delay=60, batch_size=DEFAULT_BATCH_SIZE, lease=DEFAULT_LEASE,
+                 **options):
+        super().__init__(**options)
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.batch_size = batch_size
+        self.lease = lease
+
+    def enqueue(self, sib_form, site, email, data, session_id=None, done=(), key=None):
+        from .models import SendInBlueSubmission
+        submission = SendInBlueSubmission(form_id=sib_form.pk, site=site, email=email, session_id=session_id)
+        submission.payload = data
+        submission.done = list(done)
+        submission.save()
+        return submission
+
+    def pending(self):
+        from .models import SendInBlueSubmission
+        return SendInBlueSubmission.objects.filter(status=SendInBlueSubmission.PENDING,
+                                                   next_attempt__lte=timezone.now())
+
+    def claim(self, size):
+        '''Reserve some pending submissions to this worker, skipping the ones being claimed by others'''
+        from .outbox import lock
+        with transaction.atomic():
+            submissions = list(lock(self.pending())[:size])
+            if submissions:
+                expires = timezone.now() + timedelta(seconds=self.lease)
+                self.pending().model.objects.filter(pk__in=[s.pk for s in submissions]).update(
+                    next_attempt=expires, attempts=F('attempts') + 1)
+                for submission in submissions:
+                    submission.next_attempt = expires
+                    submission.attempts += 1
+        return submissions
+
+    def owns(self, submission):
+        '''Whether the lease of a claimed submission is still running'''
+        return submission.next_attempt > timezone.now()
+
+    def drain(self, limit=None):
+        count = 0
+        while limit is None or count < limit:
+            size = self.batch_size if limit is None else min(self.batch_size, limit - count)
+            submissions = self.claim(size)
+            if not submissions:
+                break
+            for submission in [s for s in submissions if s.attempts > self.max_attempts]:
+                self.fail(submission, RuntimeError('Interrupted during its last attempt'))
+            submissions = [s for s in submissions if s.attempts <= self.max_attempts]
+            # Build all steps first so batched contacts are sent together
+            steps = {}
+            for submission in submissions:
+                if not self.owns(submission):
+                    continue
+                try:
+                    steps[submission.pk] = submission.prepare()
+                except Exception:
+                    # Raised again and reported by its attempt
+                    pass
+            for submission in submissions:
+                if not self.owns(submission):
+                    # The submission may be claimed by another worker
+                    continue
+                self.attempt(submission, steps.get(submission.pk))
+                count += 1
+        return count
+
+    def attempt(self, submission, steps=None):
+        '''Process a claimed submission and save the outcome'''
+        try:
+            submission.done = submission.process(steps)
+        except Exception as e:
+            # Steps performed before an unexpected error are not known
+            submission.done = getattr(e, 'done', submission.done)
+            self.fail(submission, e)
+        else:
+            submission.status = submission.DONE
+            submission.save()
+
+    def fail(self, submission, error):
+        '''Schedule a retry of a failed submission, or mark it as failed after too many attempts'''
+        submission.last_error = str(error) or repr(error)
+        if submission.attempts >= self.max_attempts:
+            submission.status = submission.FAILED
+            log.error('Submission %s failed after %s attempts: %s', submission.pk, submission.attempts, error)
+        else:
+            delay = self.retry_delay * 2 ** (submission.attempts - 1)
+            submission.next_attempt = timezone.now() + timedelta(seconds=delay)
+        submission.save()
+
+
+class OutboxBackend(BaseBackend):
+    '''
+    Record each side effect of a submission in the outbox (see :mod:`sendinblue.outbox`).
+
+    Side effects are performed by the outbox dispatcher,
+    without calling the ``after_sendinblue_submission`` hooks.
+    '''
+    def enqueue(self, sib_form, site, email, data, session_id=None, done=(), key=None):
+        from .outbox import record_submission
+        return record_submission(sib_form, site, email, data, session_id, done, key)
+
+    def drain(self, limit=None):
+        from .outbox import get_dispatcher
+        return get_dispatcher().dispatch(limit)
+
+
+def get_backend():
+    '''Instanciate the configured submission queue backend'''
+    backend = import_string(setting('QUEUE_BACKEND', DEFAULT_BACKEND))
+    return backend(**setting('QUEUE_OPTIONS', {}))
+
+
+def submit(sib_form, site, email, data, session_id=None):
+    '''
+    Enqueue a validated form submission, unless it is a duplicate.
+
+    The same data submitted twice on the same form within ``SENDINBLUE_DEDUP_WINDOW`` seconds
+    (ie. a double click or a retried request) is only processed once.
+
+    :returns: ``False`` if the submission is a duplicate
+    :rtype: bool
+    '''
+    key = uuid.uuid4().hex
+    window = setting('DEDUP_WINDOW', DEDUP_WINDOW)
+    dedup_key = None
+    if window:
+        fingerprint = cache.digest(json.dumps([sib_form.pk, email, data], sort_keys=True))
+        dedup_key = cache.make_key('submission', fingerprint)
+        if not cache.get_cache().add(dedup_key, key, window):
+            log.info('Ignoring duplicate submission of form "%s"', sib_form)
+            return False
+    try:
+        failed = get_backend().enqueue(sib_form, site, email, data, session_id, key=key) is False
+    except Exception:
+        failed = True
+        raise
+    finally:
+        if failed and dedup_key:
+            # Let the user submit again
+            cache.get_cache().delete(dedup_key)
+    return True
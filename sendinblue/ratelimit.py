@@ -0,0 +1,192 @@
+'''
+Client-side rate limiting.
+
+Requests are rate limited per endpoint group
+(see :attr:`sendinblue.endpoints.Endpoint.group`, ``automation`` for the automation API)::
+
+    configure_limiter({
+        'transactional': {'rate': 10, 'burst': 20},
+        'contacts': {'rate': 5},
+        'default': {'rate': 20},
+    })
+
+Each group rate is lowered on ``429`` and ``5xx`` responses
+and raised back progressively on successful ones (additive increase, multiplicative decrease),
+so the throughput settles around the maximum rate accepted by SendInBlue.
+'''
+import threading
+import time
+
+from .timeouts import DeadlineExceeded
+
+#: Response statuses slowing down a group
+THROTTLE_STATUSES = (429, 500, 502, 503, 504)
+#: Group used for groups without their own limits
+DEFAULT_GROUP = 'default'
+#: Lowest fraction of a group rate adaptive throttling can go down to
+MIN_FACTOR = 0.1
+#: Rate fraction recovered on each successful response
+RECOVERY = 0.02
+#: Maximum number of future windows a shared bucket reserves into
+MAX_WINDOWS = 60
+
+
+class TokenBucket(object):
+    '''
+    A thread-safe in-process token bucket.
+
+    :param float burst: Maximum number of tokens (default to one second worth of tokens)
+    '''
+    def __init__(self, burst=None):
+        self.burst = burst
+        self._tokens = None
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def reserve(self, rate):
+        '''
+        Take a token, possibly ahead of time.
+
+        :param float rate: The number of tokens per second
+        :returns: the number of seconds to wait before using the token
+        :rtype: float
+        '''
+        burst = self.burst or max(rate, 1)
+        with self._lock:
+            now = time.time()
+            tokens = burst if self._tokens is None else self._tokens
+            self._tokens = min(burst, tokens + (now - self._updated) * rate) - 1
+            self._updated = now
+            return max(-self._tokens / rate, 0)
+
+
+class SharedBucket(object):
+    '''
+    A bucket shared by all processes through a cache.
+
+    Tokens are counted in one-second windows:
+    once a window is full, the next one with a free slot is reserved.
+
+    :param callable cache: Returns the cache to use (ie. a Django cache)
+    :param str key: The cache key prefix of this bucket
+    '''
+    def __init__(self, cache, key):
+        self.cache = cache
+        self.key = key
+
+    def reserve(self, rate):
+        cache = self.cache()
+        now = time.time()
+        limit = max(int(rate), 1)
+        window = int(now)
+        for _ in range(MAX_WINDOWS):
+            key = '{0}:{1}'.format(self.key, window)
+            cache.add(key, 0, int(window - now) + 2)
+            try:
+                count = cache.incr(key)
+            except ValueError:
+                # Expired in between
+                continue
+            if count <= limit:
+                return max(window - now, 0)
+            window += 1
+        return window - now
+
+
+class RateLimiter(object):
+    '''
+    Rate limits by endpoint group.
+
+    :param dict limits: ``rate`` (requests per second) and optional ``burst`` by group.
+        Groups without limits use the ``default`` ones, if any.
+        Shared buckets allow bursts of one second worth of requests.
+    :param callable cache: If given, buckets are shared through this cache (see :class:`SharedBucket`)
+    :param str prefix: The shared buckets cache keys prefix
+    '''
+    def __init__(self, limits, cache=None, prefix='sendinblue:ratelimit'):
+        self.limits = limits
+        self.cache = cache
+        self.prefix = prefix
+        self._buckets = {}
+        self._factors = {}
+        self._lock = threading.Lock()
+
+    def _group(self, group):
+        return group if group in self.limits else DEFAULT_GROUP
+
+    def _bucket(self, group):
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(group)
+                if bucket is None:
+                    if self.cache is None:
+                        bucket = TokenBucket(self.limits[group].get('burst'))
+                    else:
+                        bucket = SharedBucket(self.cache, '{0}:{1}'.format(self.prefix, group))
+                    self._buckets[group] = bucket
+        return bucket
+
+    def rate(self, group):
+        '''The current rate of a group, lowered by adaptive throttling'''
+        group = self._group(group)
+        if group not in self.limits:
+            return None
+        return self.limits[group]['rate'] * self._factors.get(group, 1)
+
+    def reserve(self, group):
+        '''
+        Reserve a request slot.
+
+        :returns: the number of seconds to wait before sending the request
+        :rtype: float
+        '''
+        rate = self.rate(group)
+        if rate is None:
+            return 0
+        return self._bucket(self._group(group)).reserve(rate)
+
+    def acquire(self, group, timeout=None):
+        '''
+        Wait for a request slot.
+
+        :param float timeout: Maximum number of seconds to wait
+        :raises DeadlineExceeded: right away if the slot is further away than ``timeout``
+        '''
+        delay = self.reserve(group)
+        if timeout is not None and delay >= timeout:
+            raise DeadlineExceeded('Rate limited for {0:.2f}s past the deadline'.format(delay - timeout))
+        if delay > 0:
+            time.sleep(delay)
+
+    def feedback(self, group, status):
+        '''Adapt a group rate to a response status'''
+        group = self._group(group)
+        if group not in self.limits:
+            return
+        with self._lock:
+            factor = self._factors.get(group, 1)
+            if status in THROTTLE_STATUSES:
+                factor = max(factor / 2, MIN_FACTOR)
+            elif factor < 1:
+                factor = min(factor + RECOVERY, 1)
+            self._factors[group] = factor
+
+
+_limiter = None
+
+
+def get_limiter():
+    '''Get the process-wide rate limiter, if any'''
+    return _limiter
+
+
+def configure_limiter(limits, cache=None):
+    '''
+    Set the process-wide rate limiter.
+
+    Accepts the same parameters as :class:`RateLimiter`, ``None`` disables rate limiting.
+    '''
+    global _limiter
+    _limiter = RateLimiter(limits, cache=cache) if limits else None
+    return _limiter
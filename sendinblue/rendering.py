@@ -0,0 +1,92 @@
+'''
+Cached rendering of the SendInBlue snippets and blocks.
+
+- the ``sendinblue`` template tag and Jinja global only depend on the site settings,
+  so they are rendered once per site and settings version in each process
+  (for at most :data:`~sendinblue.cache.LOCAL_TTL` seconds).
+- form blocks markup is shared through the Django cache for each form revision and language,
+  only the CSRF token is filled in for each request.
+- iframe form blocks only depend on their embed code and are memoized in each process.
+'''
+import time
+
+from functools import lru_cache
+
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.safestring import mark_safe
+
+from . import cache
+from .forms import get_revision
+from .utils import setting
+
+TEMPLATE = 'sendinblue/template_tag.html'
+
+#: Default form markup cache lifetime in seconds
+FORM_HTML_TTL = 24 * 60 * 60
+
+#: Stands for the CSRF token in cached form markups
+CSRF_PLACEHOLDER = 'SENDINBLUE-CSRF-TOKEN'
+
+#: Form attributes used by the form block template, besides its definition
+FORM_ATTRIBUTES = ('submit_text', 'submit_layout', 'submit_variant', 'thankyou_title', 'thankyou_text')
+
+#: Number of distinct iframe blocks kept rendered
+IFRAME_CACHE_SIZE = 128
+
+#: Rendered snippets, by site id: (settings version, html, expiration timestamp)
+_rendered = {}
+
+
+def render_tag(request):
+    '''Render the SendInBlue tracking snippet for the current site'''
+    from .models import SendinBlueSettings
+    settings = SendinBlueSettings.for_request(request)
+    now = time.time()
+    entry = _rendered.get(settings.site_id)
+    if entry is None or entry[0] != settings.version or entry[2] < now:
+        html = mark_safe(render_to_string(TEMPLATE, {'sendinblue_settings': settings}))
+        entry = _rendered[settings.site_id] = (settings.version, html, now + cache.LOCAL_TTL)
+    return entry[1]
+
+
+def form_key(sib_form):
+    '''A cache key identifying a form markup content in the active language'''
+    attributes = [str(getattr(sib_form, name)) for name in FORM_ATTRIBUTES]
+    return cache.make_key('form-html', sib_form.pk, get_revision(sib_form.definition), cache.digest(attributes),
+                          translation.get_language())
+
+
+def get_csrf_token(context):
+    if not context:
+        return ''
+    request = context.get('request')
+    if request is not None:
+        return get_token(request)
+    token = context.get('csrf_token')
+    return '' if token in (None, 'NOTPROVIDED') else str(token)
+
+
+def render_form(template, sib_form, context=None):
+    '''
+    Render a form block.
+
+    :param str template: The form block template
+    :param SendInBlueForm sib_form: The form to render
+    :param dict context: The parent context, used to get the CSRF token
+    '''
+    store = cache.get_cache()
+    key = form_key(sib_form)
+    html = store.get(key)
+    if html is None:
+        html = render_to_string(template, {'form': sib_form, 'csrf_token': CSRF_PLACEHOLDER})
+        store.set(key, html, cache.local_ttl(setting('FORM_HTML_TTL', FORM_HTML_TTL)))
+    return mark_safe(html.replace(CSRF_PLACEHOLDER, get_csrf_token(context)))
+
+
+@lru_cache(maxsize=IFRAME_CACHE_SIZE)
+def render_iframe(template, value):
+    '''Render an iframe form block'''
+    from .models import IFrameFormBlock
+    return mark_safe(render_to_string(template, {'value': value, 'iframe': IFrameFormBlock.parse(value)}))
@@ -0,0 +1,131 @@
+'''
+Retries and circuit breakers.
+
+Idempotent endpoints calls failing with a transient error
+(connection error, timeout, ``429`` or ``5xx`` response)
+are retried with a jittered exponential backoff (see :class:`RetryPolicy`).
+Other calls are only retried when the connection could not be established.
+
+Each endpoint group has its own :class:`CircuitBreaker`:
+after too many consecutive transient errors, calls to the group fail fast
+with :class:`~sendinblue.client.CircuitOpen` until it is tried again.
+'''
+import random
+import threading
+import time
+
+DEFAULT_ATTEMPTS = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 5
+DEFAULT_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30
+
+
+class RetryPolicy(object):
+    '''
+    An exponential backoff with full jitter.
+
+    :param int attempts: Maximum number of attempts (including the first one)
+    :param float backoff: Base delay in seconds, doubled on each attempt
+    :param float max_backoff: Maximum delay in seconds
+    '''
+    def __init__(self, attempts=DEFAULT_ATTEMPTS, backoff=DEFAULT_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def delays(self):
+        '''Yield the delay before each retry'''
+        for attempt in range(self.attempts - 1):
+            yield random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class CircuitBreaker(object):
+    '''
+    A thread-safe circuit breaker.
+
+    The circuit opens after ``threshold`` consecutive failures.
+    Then a single trial call is allowed every ``reset_timeout`` seconds:
+    the circuit closes as soon as one succeeds.
+    '''
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened is None:
+            return self.CLOSED
+        if time.time() < self.opened + self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow(self):
+        '''Whether a call can be attempted'''
+        with self._lock:
+            state = self.state
+            if state == self.HALF_OPEN:
+                # Let this call through and keep the others out until it is done
+                self.opened = time.time()
+            return state != self.OPEN
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened = None
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.opened is not None or self.failures >= self.threshold:
+                self.opened = time.time()
+
+
+_retry = RetryPolicy()
+_breaker_options = {}
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_retry_policy():
+    '''Get the process-wide retry policy'''
+    return _retry
+
+
+def configure_retry(**kwargs):
+    '''
+    Replace the process-wide retry policy.
+
+    Accepts the same parameters as :class:`RetryPolicy`.
+    '''
+    global _retry
+    _retry = RetryPolicy(**kwargs)
+    return _retry
+
+
+def get_breaker(group):
+    '''Get the process-wide circuit breaker of an endpoint group'''
+    breaker = _breakers.get(group)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(group, CircuitBreaker(**_breaker_options))
+    return breaker
+
+
+def configure_breakers(**kwargs):
+    '''
+    Configure the circuit breakers (existing ones are reset).
+
+    Accepts the same parameters as :class:`CircuitBreaker`.
+    '''
+    global _breaker_options
+    with _breakers_lock:
+        _breaker_options = kwargs
+        _breakers.clear()
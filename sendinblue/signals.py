@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import cache
+from .forms import evict_form
+from .models import SendInBlueForm, SendinBlueSettings
+
+
+@receiver(post_save, sender=SendInBlueForm)
+@receiver(post_delete, sender=SendInBlueForm)
+def on_form_change(sender, instance, **kwargs):
+    SendInBlueForm.invalidate_config(instance.pk)
+    evict_form(instance.pk)
+
+
+@receiver(post_save, sender=SendinBlueSettings)
+def on_settings_change(sender, instance, **kwargs):
+    cache.invalidate(SendinBlueSettings.namespace(instance.site_id))
@@ -1,16 +1,13 @@
 from django.template import Library
 
-from ..models import SendinBlueSettings
+from ..rendering import render_tag
 
 register = Library()
 
 
-@register.inclusion_tag('sendinblue/template_tag.html', takes_context=True)
+@register.simple_tag(takes_context=True)
 def sendinblue(context):
-    request = context['request']
-    settings = SendinBlueSettings.for_site(request.site)
-    context.update(sendinblue_settings=settings)
-    return context
+    return render_tag(context['request'])
 
 
 @register.filter
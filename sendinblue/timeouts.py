@@ -0,0 +1,126 @@
+'''
+Timeout profiles and deadlines.
+
+Each API call uses separate connect and read timeouts,
+looked up by endpoint name, then by endpoint group, then ``default``::
+
+    configure_timeouts({
+        'default': (5, 30),
+        'transactional': (3, 10),
+        'export_users': (5, 120),
+    })
+
+A deadline bounds a whole flow of calls::
+
+    with deadline(10):
+        api.create_update_user(email, data)
+        api.add_users_list(list_id, [email])
+
+Calls are given the remaining time at most and fail with :class:`DeadlineExceeded` once it is over.
+Deadlines are thread-local: use :func:`bind` to carry one to other threads.
+They do not apply to asyncio clients (use :func:`asyncio.wait_for` instead).
+The read timeout applies between received bytes, so a call can exceed
+the remaining time when a response keeps trickling in.
+'''
+import threading
+import time
+
+from contextlib import contextmanager
+from functools import wraps
+
+import requests
+
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 30
+
+#: Built-in (connect, read) timeouts
+DEFAULT_PROFILES = {
+    'default': (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+    'transactional': (DEFAULT_CONNECT_TIMEOUT, 15),
+    'automation': (DEFAULT_CONNECT_TIMEOUT, 5),
+}
+
+_profiles = dict(DEFAULT_PROFILES)
+_local = threading.local()
+
+
+class DeadlineExceeded(requests.Timeout):
+    '''Raised instead of calling SendInBlue once the current deadline is over'''
+
+
+def configure_timeouts(profiles):
+    '''
+    Override timeout profiles.
+
+    :param dict profiles: ``(connect, read)`` pairs or a single value for both,
+        by endpoint name, endpoint group or ``default``
+    '''
+    for name, timeout in profiles.items():
+        _profiles[name] = tuple(timeout) if isinstance(timeout, (list, tuple)) else (timeout, timeout)
+
+
+def get_timeout(*names):
+    '''Get the ``(connect, read)`` timeouts of the first profile matching one of ``names``'''
+    for name in names:
+        if name in _profiles:
+            return _profiles[name]
+    return _profiles['default']
+
+
+def get_deadline():
+    '''The current thread deadline timestamp, if any'''
+    return getattr(_local, 'deadline', None)
+
+
+def remaining():
+    '''The number of seconds left before the current deadline, if any'''
+    current = get_deadline()
+    return None if current is None else current - time.time()
+
+
+@contextmanager
+def deadline(seconds):
+    '''
+    Bound the duration of all calls in this block.
+
+    Nested deadlines can only shorten the current one. ``None`` keeps it unchanged.
+    '''
+    previous = get_deadline()
+    if seconds is not None:
+        limit = time.time() + seconds
+        _local.deadline = limit if previous is None else min(previous, limit)
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def clamp(timeout):
+    '''
+    Limit a timeout (a single value or a ``(connect, read)`` pair) to the remaining time.
+
+    :raises DeadlineExceeded: if the current deadline is over
+    '''
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded('Deadline exceeded')
+    if isinstance(timeout, tuple):
+        return tuple(min(t, left) for t in timeout)
+    return min(timeout, left)
+
+
+def bind(func):
+    '''Wrap ``func`` to run it with the current deadline, ie. in another thread'''
+    current = get_deadline()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = get_deadline()
+        _local.deadline = current
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.deadline = previous
+    return wrapper
@@ -0,0 +1,63 @@
+'''
+SendInBlue access tokens used by the embedded administration pages.
+
+Tokens are shared by all processes through the Django cache, per API key,
+until ``SENDINBLUE_TOKEN_MARGIN`` seconds before they expire.
+Replaced tokens are revoked in the background.
+'''
+import logging
+import time
+
+from . import cache
+from .client import Client, check
+from .utils import setting
+
+log = logging.getLogger(__name__)
+
+#: Default access tokens lifetime in seconds, when not given by SendInBlue
+TOKEN_TTL = 30 * 60
+#: Default number of seconds before expiry a token is replaced
+TOKEN_MARGIN = 2 * 60
+
+
+def cache_key(apikey):
+    return cache.make_key('token', cache.digest(apikey))
+
+
+def revoke(apikey, token):
+    '''Revoke an access token, logging failures'''
+    try:
+        check(Client(apikey).delete_token(token))
+    except Exception:
+        log.exception('Unable to revoke a SendInBlue access token')
+
+
+def get_access_token(apikey):
+    '''
+    Get a valid access token for an API key, from cache if possible.
+
+    A single process renews a token at once: meanwhile the others keep using the current one.
+    '''
+    store = cache.get_cache()
+    key = cache_key(apikey)
+    lock = cache.make_key(key, 'lock')
+    now = time.time()
+    cached = store.get(key)
+    if cached is not None and now < cached[1] - setting('TOKEN_MARGIN', TOKEN_MARGIN):
+        return cached[0]
+
+    locked = store.add(lock, True, 60)
+    if not locked and cached is not None and now < cached[1]:
+        return cached[0]
+    try:
+        data = check(Client(apikey).get_access_tokens())['data']
+        ttl = int(data.get('expires_in') or setting('TOKEN_TTL', TOKEN_TTL))
+        store.set(key, (data['access_token'], now + ttl), ttl)
+    finally:
+        if locked:
+            store.delete(lock)
+
+    if cached is not None and now < cached[1]:
+        from .pipeline import get_background_executor
+        get_background_executor().submit(revoke, apikey, cached[0])
+    return data['access_token']
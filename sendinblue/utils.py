@@ -1,4 +1,10 @@
+from django.conf import settings
 from django.utils.functional import lazy
 from django.utils.safestring import mark_safe
 
 mark_safe_lazy = lazy(mark_safe, str)
+
+
+def setting(name, default=None):
+    '''Get a ``SENDINBLUE_``-prefixed Django setting'''
+    return getattr(settings, 'SENDINBLUE_{0}'.format(name), default)
@@ -1,13 +1,17 @@
-from collections import defaultdict
-
-from django.http import JsonResponse
-from django.shortcuts import render
+from django.contrib import messages
+from django.http import Http404, JsonResponse
+from django.shortcuts import render, redirect
+from django.utils.http import is_safe_url
 from django.utils.translation import ugettext_lazy as _
+from django.views.decorators.http import require_POST
 from django.views.decorators.vary import vary_on_headers
 
-from .client import Client, AutomationClient
-from .forms import SendInBlueDynamicForm
+from . import cache, dashboard as dashboard_data
+from .client import Client
+from .forms import compile_form
 from .models import SendinBlueSettings, SendInBlueForm
+from .queue import submit
+from .tokens import get_access_token
 
 
 CAMPAIGN_STATUS = (
@@ -30,47 +34,44 @@ def welcome(request):
 
 def dashboard(request):
     '''Display the admin dahsboard view'''
-    settings = SendinBlueSettings.for_site(request.site)
+    settings = SendinBlueSettings.for_request(request)
     if not settings.apikey:
         return welcome(request)
 
     api = Client(settings.apikey)
 
-    data = api.get_account()
-    infos = data['data'][-1]
-    plans = data['data'][:-1]
-
-    data = api.get_lists()
-    list_ids = []
-    if data['code'] == 'success':
-        for listdata in data['data']['lists']:
-            list_ids.append(listdata['id'])
-        users_data = api.display_list_users(list_ids)
-        total_contacts = users_data['data']['total_list_records']
-    else:
-        total_contacts = 0
-
-    return render(request, 'sendinblue/admin.html', {
+    context = dashboard_data.load(api)
+    context.update({
         'title': 'SendInBlue - {0}'.format(_('Dashboard')),
-        'infos': infos,
-        'plans': plans,
-        'total_contacts': total_contacts,
-        'campaigns': get_campaign_stats(api),
         'campaigns_order': ('classic', 'sms', 'trigger'),
         'campaign_status': CAMPAIGN_STATUS,
     })
+    return render(request, 'sendinblue/admin.html', context)
+
+
+#: Cache namespaces cleared by the refresh action
+REFRESHABLE = ('choices', 'attributes', 'dashboard')
+
+
+@require_POST
+def refresh(request):
+    '''Clear the cached SendInBlue data (lists, templates, attributes...)'''
+    for namespace in REFRESHABLE:
+        cache.invalidate(namespace)
+    messages.success(request, _('SendInBlue data will be refreshed'))
+    next_url = request.POST.get('next')
+    if not next_url or not is_safe_url(next_url, host=request.get_host()):
+        next_url = 'sendinblue:dashboard'
+    return redirect(next_url)
 
 
 def iframe_factory(name, title):
     def view(request):
-        settings = SendinBlueSettings.for_site(request.site)
+        settings = SendinBlueSettings.for_request(request)
         if not settings.apikey:
             return welcome(request)
 
-        api = Client(settings.apikey)
-
-        data = api.get_access_tokens()
-        access_token = data['data']['access_token']
+        access_token = get_access_token(settings.apikey)
 
         ctx = {
             # 'name': name,
@@ -87,68 +88,19 @@ def iframe_factory(name, title):
     return view
 
 
-def get_campaign_stats(api):
-    response = api.get_campaigns_v2()
-
-    data = {
-        'classic': {
-            'name': _('Email campaigns'),
-            'icon': 'fa-envelope',
-            'stats':  defaultdict(lambda: 0),
-        },
-        'sms': {
-            'name': _('SMS campaigns'),
-            'icon': 'fa-mobile',
-            'stats':  defaultdict(lambda: 0),
-        },
-        'trigger': {
-            'name': _('Trigger marketing'),
-            'icon': 'fa-toggle-right',
-            'stats':  defaultdict(lambda: 0),
-        }
-    }
-
-    campaigns = response['data']['campaign_records'] if response['code'] == api.OK else []
-    for campaign in campaigns:
-        if campaign['type'] == 'template' or not campaign['type'] == '':
-            continue
-        data[campaign['type']]['stats'][campaign['status']] += 1
-
-    return data
-
-
 @vary_on_headers('HTTP_X_REQUESTED_WITH')
 def submit_form(request, pk):
-    sib_form = SendInBlueForm.objects.get(pk=int(pk))
+    try:
+        sib_form = SendInBlueForm.get_config(int(pk))
+    except SendInBlueForm.DoesNotExist:
+        raise Http404
     if request.method == 'POST':
-        form = SendInBlueDynamicForm(request.POST, builder=sib_form.definition)
+        form = compile_form(sib_form)(request.POST)
         if form.is_valid():
             data = dict(**form.cleaned_data)
             email = data.pop('EMAIL')
-            settings = SendinBlueSettings.for_site(request.site)
-            api = Client(settings.apikey)
-
-            api.create_update_user(email, data)
-
-            if sib_form.target_list:
-                api.add_users_list(sib_form.target_list, [email])
-
-            data_formated = dict((k, v.replace('\n', '<br/>')) for k, v in data.items())
-            data_formated.update(EMAIL=email)
-
-            if sib_form.confirm_template:
-                api.send_transactional_template(sib_form.confirm_template, email, attr=data_formated)
-            if sib_form.notify_template and settings.notify_email:
-                api.send_transactional_template(sib_form.notify_template, settings.notify_email, attr=data_formated)
-
-            if settings.automation:
-                session_id = request.session.session_key
-                data['session_id'] = session_id
-                automation = AutomationClient(settings.automation)
-                if settings.track_users or sib_form.send_event:
-                    automation.identify(email, **data)
-                if sib_form.send_event:
-                    automation.track(sib_form.send_event, session_id=session_id, email_id=email)
+            # Duplicates get the same response without being processed again
+            submit(sib_form, request.site, email, data, request.session.session_key)
 
             if request.is_ajax():
                 return JsonResponse({
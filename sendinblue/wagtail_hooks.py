@@ -10,7 +10,7 @@ from wagtail.contrib.modeladmin.options import (
 
 from . import urls
 from .models import SendInBlueForm, SendinBlueSettings
-from .views import dashboard, iframe_factory, welcome
+from .views import dashboard, iframe_factory, refresh, welcome
 
 
 @hooks.register('register_admin_urls')
@@ -18,6 +18,7 @@ def register_admin_urls():
     return [
         url(r'^sendinblue/', include([
             url(r'^dashboard/$', dashboard, name='dashboard'),
+            url(r'^refresh/$', refresh, name='refresh'),
             url(r'^lists/$', iframe_factory('lists/index', _('Lists')), name='lists'),
             url(r'^contacts/$', iframe_factory('users/list', _('Contacts')), name='contacts'),
             url(r'^campaigns/$', iframe_factory('camp/listing', _('Campaigns')), name='campaigns'),
@@ -38,7 +39,7 @@ class FormAdmin(ModelAdmin):
     search_fields = ('name', )
 
     def need_api_key(self, view_name, request, *args, **kwargs):
-        settings = SendinBlueSettings.for_site(request.site)
+        settings = SendinBlueSettings.for_request(request)
         if not settings.apikey:
             return welcome(request)
         view_func = getattr(super(), view_name)
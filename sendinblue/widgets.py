@@ -1,52 +1,53 @@
 from django.forms import Select
 from django.utils.functional import lazy
-from wagtail.wagtailcore.models import Site
 
+from . import cache
+from .attributes import default_site
 from .client import Client
+from .utils import setting
+
+#: Default choices lifetime in seconds
+CHOICES_TTL = 60 * 60
 
 
 class ApiSelect(Select):
+    '''
+    A select whose choices are fetched from the SendInBlue API.
+
+    Choices are shared by all widgets (and all processes through the Django cache)
+    for ``SENDINBLUE_CHOICES_TTL`` seconds and can be refreshed from the admin.
+    '''
     def __init__(self, attrs=None, **kwargs):
         super(ApiSelect, self).__init__(attrs, ())
         self.choices = lazy(self._get_choices, tuple)()
-        self._cached_choices = None
 
     def _get_choices(self):
-        if self._cached_choices is None:
-            from .models import SendinBlueSettings
-            site = Site.objects.first()
-            settings = SendinBlueSettings.for_site(site)
-            api = Client(settings.apikey)
-            self._cached_choices = self.get_choices(api)
-        return self._cached_choices
+        # Looked up on each render: widgets live as long as their form class
+        from .models import SendinBlueSettings
+        site = default_site()
+        settings = SendinBlueSettings.for_site(site)
+        api = Client(settings.apikey)
+        parts = [site.pk, cache.digest(settings.apikey), type(self).__name__, self.is_required]
+        return cache.get_shared('choices', parts, lambda: list(self.get_choices(api)),
+                                setting('CHOICES_TTL', CHOICES_TTL))
 
     def get_choices(self, api):
         raise NotImplementedError
 
 
 class AttributesSelect(ApiSelect):
-    def get_choices(self, api):
-        data = api.get_attributes()
-        attributes = data['data']['normal_attributes']
-        names = [a['name'] for a in attributes]
-        return map(lambda n: (n, n), names)
+    def _get_choices(self):
+        from .attributes import get_names
+        return [(n, n) for n in get_names(email=False)]
 
 
 class ListSelect(ApiSelect):
     def get_choices(self, api):
-        data = api.get_lists()
-        choices = [
-            (l['id'], l['name'])
-            for l in data['data']['lists']
-        ]
+        choices = [(l['id'], l['name']) for l in api.iter_lists()]
         return choices if self.is_required else [(None, '')] + choices
 
 
 class TemplateSelect(ApiSelect):
     def get_choices(self, api):
-        data = api.get_campaigns_v2('template', 'draft', 1, 500)
-        choices = [
-            (l['id'], l['campaign_name'])
-            for l in data['data']['campaign_records']
-        ]
+        choices = [(l['id'], l['campaign_name']) for l in api.iter_campaigns('template', 'draft')]
         return choices if self.is_required else [(None, '')] + choices
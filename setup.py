@@ -123,6 +123,7 @@ setup(
     install_requires=['requests'],
     tests_require=[],
     extras_require={
+        'async': ['aiohttp>=3.3'],
         'test': [],
         'doc': [],
         # 'dev': pip('develop'),
@@ -0,0 +1,31 @@
+import unittest
+
+from sendinblue.client import BatchClient, Client
+from sendinblue.endpoints import ENDPOINTS
+
+
+class BatchClientTest(unittest.TestCase):
+    def test_iterators_are_not_supported(self):
+        batch = BatchClient('apikey')
+        with self.assertRaises(TypeError):
+            batch.iter_lists()
+        self.assertEqual(batch.execute(), [])
+
+    def test_endpoint_calls_are_collected(self):
+        batch = BatchClient('apikey')
+        future = batch.get_account()
+        self.assertFalse(future.done())
+        self.assertEqual(len(batch._calls), 1)
+
+
+class CampaignsTest(unittest.TestCase):
+    def test_unfiltered_campaigns_page(self):
+        endpoint = ENDPOINTS['get_campaigns_v2']
+        self.assertEqual(endpoint.build({'type': None, 'status': None, 'page': 2, 'page_limit': 10}),
+                         ('campaign/detailsv2/', {}))
+
+    def test_iterator_requires_filters(self):
+        with self.assertRaises(TypeError):
+            Client('apikey').iter_campaigns()
+        with self.assertRaises(TypeError):
+            Client('apikey').iter_campaigns('template', None)